@@ -8,45 +8,53 @@ data visualizations using Plotly.
 __version__ = "0.1.0"
 __author__ = "Benjamin Marcus Jones"
 
-# Import utility functions first (needed for template loading)
+# Built-in templates are registered lazily, the first time one is needed
 from .util import util_plotly
 
-# Auto-load all built-in templates upon import
-try:
-    util_plotly.load_all_builtin_templates()
-except Exception as e:
-    import logging
-    logging.warning(f"Failed to auto-load some templates: {e}")
+import importlib
+import importlib.util
+
+# Plotting functions and marimo components are imported on first attribute
+# access (PEP 562), so importing climatevis does not pull in every plot module
+_LAZY_IMPORTS = {
+    'wind_rose': '.plots',
+    'exceedance': '.plots',
+    'exceedance_bands': '.plots',
+    'annual_heatmap': '.plots',
+    'annual_profile_daily': '.plots',
+    'annual_profile_multiple': '.plots',
+    'plot_series': '.plots',
+    'plot_timeseries_df': '.plots',
+    'plot_rotated_box': '.plots',
+    'histogram': '.plots',
+    'cumulative_probability': '.plots',
+    'monthly_profiles': '.plots',
+    'monthly_profiles_bands': '.plots',
+    'weather_selection': '.components',
+    'create_template_dropdown': '.components',
+    'create_paper_size_dropdown': '.components',
+    'get_template_options': '.components',
+    'get_paper_size_options': '.components',
+}
+_LAZY_SUBMODULES = ('plots', 'components')
+
+# Components degrade gracefully without marimo; only advertise them when it is installed
+_HAS_MARIMO = importlib.util.find_spec("marimo") is not None
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
 
-# Import key functions at package level for easy access
-from .plots import (
-    wind_rose,
-    exceedance,
-    exceedance_bands,
-    annual_heatmap,
-    annual_profile_daily,
-    annual_profile_multiple,
-    plot_series,
-    plot_timeseries_df,
-    plot_rotated_box,
-    histogram,
-    cumulative_probability,
-    monthly_profiles,
-    monthly_profiles_bands
-)
 
-# Import components (with optional marimo dependency)
-try:
-    from .components import (
-        weather_selection,
-        create_template_dropdown,
-        create_paper_size_dropdown,
-        get_template_options,
-        get_paper_size_options
-    )
-    _HAS_MARIMO = True
-except ImportError:
-    _HAS_MARIMO = False
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_LAZY_SUBMODULES))
 
 # Import template management functions
 from .util.util_plotly import (
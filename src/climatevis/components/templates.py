@@ -11,6 +11,14 @@ except ImportError:
     _HAS_MARIMO = False
     mo = None
 
+# Standard paper sizes offered by the dropdowns
+_PAPER_SIZES = (
+    "A4_LANDSCAPE", "A4_PORTRAIT",
+    "A5_LANDSCAPE", "A5_PORTRAIT",
+    "A3_LANDSCAPE", "A3_PORTRAIT",
+    "A6_LANDSCAPE", "A6_PORTRAIT"
+)
+
 def create_template_dropdown(value="base", label="Chart Template", **kwargs):
     """
     Create a marimo dropdown pre-configured with all available templates.
@@ -71,16 +79,8 @@ def create_paper_size_dropdown(value="A4_LANDSCAPE", label="Paper Size", **kwarg
     if not _HAS_MARIMO:
         raise ImportError("marimo is required to use template UI components. Install with: pip install marimo")
 
-    # Standard paper sizes available in climatevis
-    paper_size_options = [
-        "A4_LANDSCAPE", "A4_PORTRAIT",
-        "A5_LANDSCAPE", "A5_PORTRAIT",
-        "A3_LANDSCAPE", "A3_PORTRAIT",
-        "A6_LANDSCAPE", "A6_PORTRAIT"
-    ]
-
     return mo.ui.dropdown(
-        options=paper_size_options,
+        options=list(_PAPER_SIZES),
         value=value,
         label=label,
         **kwargs
@@ -107,9 +107,4 @@ def get_paper_size_options():
     Returns:
         list: List of available paper size names.
     """
-    return [
-        "A4_LANDSCAPE", "A4_PORTRAIT",
-        "A5_LANDSCAPE", "A5_PORTRAIT",
-        "A3_LANDSCAPE", "A3_PORTRAIT",
-        "A6_LANDSCAPE", "A6_PORTRAIT"
-    ]
\ No newline at end of file
+    return list(_PAPER_SIZES)
\ No newline at end of file
@@ -5,14 +5,15 @@ except ImportError:
     _HAS_MARIMO = False
     mo = None
 
-import pathlib
 from pathlib import Path
 import glob
+from functools import lru_cache
 
 ####################################
 # Base weather files
 ####################################
-dict_weather_select = {
+# Fixed entries of dict_weather_select; the scanned files are added on first access
+_base_weather_dict = {
     "NEOM L3": "./Data/Weather data NEOM/NEOM_L3.epw",
     "ASHRAE Sharm El Sheikh": "./Data/Weather data ASHRAE/EGY_JS_Sharm.Sheikh.Intl.AP.624639_TMYx.epw",
     # "AQABA Mast 1 Wind": "./Data/AQABA wind/AQABA_MAST_1.epw",
@@ -32,29 +33,57 @@ climate_change_file_dict = {
     "Sharm El Sheikh RCP 8.5 2100": "./Data/Climate Change/Sharm_El_Sheikh_Airp_-hour-RCP8.5-2100EPW.epw"
 }
 
-dict_weather_select.update(climate_change_file_dict)
+_base_weather_dict.update(climate_change_file_dict)
 
 ####################################
-# Public Realm weather files
+# Scanned weather file directories
 ####################################
-public_realm_weather_files = glob.glob("./Data/Public Realm/*.epw")
-public_realm_weather_dicts = {Path(epw_path).stem: epw_path for epw_path in public_realm_weather_files}
-dict_weather_select.update(public_realm_weather_dicts)
-
+# Directory of each group of weather files, keyed by the module-level name of its file list
+_weather_file_dirs = {
+    "public_realm_weather_files": "./Data/Public Realm",  # Public Realm weather files
+    "wrf_files": "./Data/WRF FD Global EPW",  # WRF FD Global EPW weather files
+    "additional_files": "./Data/Additional cities weather",  # ASHRAE Benchmark city weather files
+}
 
-####################################
-# WRF FD Global EPW weather files
-####################################
-wrf_files = glob.glob("./Data/WRF FD Global EPW/*.epw")
-wrf_file_path_dicts = {Path(epw_path).stem: epw_path for epw_path in wrf_files}
-dict_weather_select.update(wrf_file_path_dicts)
+# Module-level name of each group's {file stem: path} mapping, and of the file list it is built from
+_weather_file_path_dicts = {
+    "public_realm_weather_dicts": "public_realm_weather_files",
+    "wrf_file_path_dicts": "wrf_files",
+    "additional_file_path_dicts": "additional_files",
+}
 
-####################################
-# ASHRAE Benchmark city weather files
-####################################
-additional_files = glob.glob("./Data/Additional cities weather/*.epw")
-additional_file_path_dicts = {Path(epw_path).stem: epw_path for epw_path in additional_files}
-dict_weather_select.update(additional_file_path_dicts)
+@lru_cache(maxsize=None)
+def _scan_weather_dir(weather_dir):
+    """Globs a weather data directory for EPW files, on first use only."""
+    return tuple(glob.glob(f"{weather_dir}/*.epw"))
+
+def _weather_path_dict(epw_paths):
+    """Maps each EPW file's stem to its path."""
+    return {Path(epw_path).stem: epw_path for epw_path in epw_paths}
+
+@lru_cache(maxsize=1)
+def _build_weather_dict():
+    """Collects the weather file options, scanning the data directories on first use only."""
+    weather_dict = dict(_base_weather_dict)
+    for weather_dir in _weather_file_dirs.values():
+        weather_dict.update(_weather_path_dict(_scan_weather_dir(weather_dir)))
+
+    return weather_dict
+
+def __getattr__(name):
+    # dict_weather_select and the per-directory file lists and dicts are built on first access,
+    # so importing the module does not touch the disk
+    if name == "dict_weather_select":
+        value = _build_weather_dict()
+    elif name in _weather_file_dirs:
+        value = list(_scan_weather_dir(_weather_file_dirs[name]))
+    elif name in _weather_file_path_dicts:
+        value = _weather_path_dict(_scan_weather_dir(_weather_file_dirs[_weather_file_path_dicts[name]]))
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
 
 def weather_selection():
     """Creates a dropdown for selecting a weather file."""
@@ -64,7 +93,7 @@ def weather_selection():
 
     # Create dropdown
     dropdown = mo.ui.dropdown(
-        options=dict_weather_select,
+        options=_build_weather_dict(),
         value="NEOM L3",
     )
 
@@ -1,9 +1,72 @@
-import plotly.express as px
 import pandas as pd
 import numpy as np
 from climatevis.util import util_plotly
 from climatevis.util.validation import validate_plot_parameters
 
+# Month layout of a (non-leap) year on a day-of-year axis
+_MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_MONTH_START_DOY = (1, 32, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+_MONTH_CENTER_DOY = tuple(start + 14 for start in _MONTH_START_DOY)  # 15th of each month
+_MONTH_BOUNDARIES = _MONTH_START_DOY + (365,)  # Add year-end as last boundary
+# Vertical month boundary lines, shifted by -0.5 to align with the start of each day and
+# extended slightly past hours 1-24 to touch the axis
+_MONTH_BOUNDARY_PATH = " ".join(f"M {day - 0.5} 0.5 L {day - 0.5} 24.5" for day in _MONTH_BOUNDARIES)
+
+# Hour-axis ticks: rows are hours 1-24 (24 included so it appears at the top), labelled 0-23
+_HOUR_TICKS = (1, 7, 13, 19, 24)
+_HOUR_TICK_TEXT = tuple(str(hour - 1) for hour in _HOUR_TICKS)
+
+
+def _is_full_hourly_year(index: pd.DatetimeIndex):
+    """Checks for 8760 naive timestamps starting at 1 January 00:00 and spaced exactly one hour apart."""
+    if len(index) != 8760 or index.tz is not None:
+        return False
+    first = index[0]
+    if first.dayofyear != 1 or first.hour != 0:
+        return False
+    return bool((np.diff(index.to_numpy()) == np.timedelta64(1, "h")).all())
+
+
+def _hour_day_grid(series: pd.Series):
+    """
+    Averages a series into an hour (1-24) x day-of-year grid with NumPy reductions.
+
+    Equivalent to a mean pivot_table on hour and day of year: NaNs are skipped and
+    rows or columns without any valid value are dropped.
+
+    Returns:
+    - pd.DataFrame indexed by "hour" with "day_of_year" columns
+    """
+    values = series.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+
+    # A complete, regular hourly year is already laid out day by day: reshape it directly
+    if _is_full_hourly_year(series.index) and valid.all():
+        return pd.DataFrame(
+            values.reshape(365, 24).T,
+            index=pd.Index(np.arange(1, 25), name="hour"),  # Hours start at 1
+            columns=pd.Index(np.arange(1, 366), name="day_of_year"),
+        )
+
+    hours = series.index.hour.to_numpy()
+    days = series.index.dayofyear.to_numpy()
+
+    # Flat key per (hour, day) slot; bincount gives the per-slot sums and counts
+    keys = hours[valid] * 367 + days[valid]
+    counts = np.bincount(keys, minlength=24 * 367).reshape(24, 367)
+    sums = np.bincount(keys, weights=values[valid], minlength=24 * 367).reshape(24, 367)
+
+    grid = np.full((24, 367), np.nan)
+    np.divide(sums, counts, out=grid, where=counts > 0)
+
+    has_hour = counts.any(axis=1)
+    has_day = counts.any(axis=0)
+    return pd.DataFrame(
+        grid[np.ix_(has_hour, has_day)],
+        index=pd.Index(np.flatnonzero(has_hour) + 1, name="hour"),  # Hours start at 1
+        columns=pd.Index(np.flatnonzero(has_day), name="day_of_year"),
+    )
+
 def annual_heatmap(series: pd.Series, template_name: str, paper_size: str, color_scale='Viridis', max_scale=0, scale_factor=0.6, show_legend=True):
     """
     Generates a heatmap displaying hourly values across the year.
@@ -31,40 +94,32 @@ def annual_heatmap(series: pd.Series, template_name: str, paper_size: str, color
         function_name="annual_heatmap"
     )
 
-    # Create DataFrame with required information
-    df = series.to_frame(name="metric")
-    df["day_of_year"] = df.index.dayofyear
-    df["hour"] = df.index.hour + 1  # Increment hour values to start at 1
-
-    # Pivot for heatmap structure (ensure 1 is at the bottom, 24 at the top)
-    heatmap_data = df.pivot_table(index="hour", columns="day_of_year", values="metric", aggfunc='mean')
-    heatmap_data = heatmap_data.sort_index(ascending=True)  # Ensure correct order with 1 at bottom
+    # Average the values into an hour x day-of-year grid (ensure 1 is at the bottom, 24 at the top)
+    heatmap_data = _hour_day_grid(series)
+    heatmap_data = heatmap_data.astype(np.float32)  # Halves the serialized z payload
 
     # Set color scale limits
     zmax = max_scale if max_scale > 0 else None
+    value_label = series.name or "Value"
 
-    # Generate heatmap
+    # Generate heatmap (plotly.express is imported lazily, it is slow to load)
+    import plotly.express as px
     fig = px.imshow(
         heatmap_data,
         # labels=dict(x="Month", y="Hour of Day", color=series.name or "Value"),
-        labels=dict(y="Hour of Day", color=series.name or "Value"),
+        labels=dict(y="Hour of Day", color=value_label),
         aspect='auto',
         color_continuous_scale=color_scale,
         origin='lower',  # Ensure 1 is at the bottom
         zmax=zmax  # Apply max scale if specified
     )
 
-    # Compute month positions centered within each month
-    months = pd.date_range("2023-01-01", "2023-12-31", freq="MS")  # Month Start
-    month_positions = {date.strftime("%b"): (date + pd.Timedelta(days=14)).dayofyear for date in months}
-    month_boundaries = [date.dayofyear for date in months] + [365]  # Add year-end as last boundary
-
     # Update x-axis ticks to show month labels without ticks
     fig.update_layout(
         xaxis=dict(
             tickmode='array',
-            tickvals=list(month_positions.values()),  # Centered positions of each month
-            ticktext=list(month_positions.keys()),  # Month names
+            tickvals=list(_MONTH_CENTER_DOY),  # Centered positions of each month
+            ticktext=list(_MONTH_NAMES),  # Month names
             showgrid=True,
             gridcolor='gray',  # Fainter grid lines
             gridwidth=0.8,
@@ -76,25 +131,24 @@ def annual_heatmap(series: pd.Series, template_name: str, paper_size: str, color
         ),
         yaxis=dict(
             tickmode='array',
-            tickvals=list(range(1, 25, 6)) + [24],  # Ensure 24 appears at the top
-            ticktext=[str(h - 1) for h in list(range(1, 25, 6)) + [24]],  # Decrement labels to show 0-23
+            tickvals=list(_HOUR_TICKS),  # Ensure 24 appears at the top
+            ticktext=list(_HOUR_TICK_TEXT),  # Decrement labels to show 0-23
             showgrid=True,
             gridcolor='lightgrey',
             range=[1, 24]  # Set range from 1 to 24
         ),
         shapes=[
             dict(
-                type="line",
-                x0=day - 0.5, x1=day - 0.5,  # Shift lines by -0.5 to align with start of day
-                y0=0.5, y1=24.5,  # Extend lines slightly to touch the axis
+                type="path",
+                path=_MONTH_BOUNDARY_PATH,  # All month boundaries drawn as one SVG path
                 line=dict(color="gray", width=1)
-            ) for day in month_boundaries
+            )
         ],
         # title=f"Annual Heatmap of {series.name or 'Metric'}",
         # xaxis_title="Month",
         yaxis_title="Hour of Day",
         # coloraxis_colorbar=dict(title=series.name or "Value", visible=show_legend)
-        coloraxis=dict(colorbar=dict(title=series.name or "Value")) if show_legend else dict(showscale=False)
+        coloraxis=dict(colorbar=dict(title=value_label)) if show_legend else dict(showscale=False)
 
         # coloraxis_colorbar=dict(title=series.name or "Value")
     )
@@ -4,12 +4,67 @@ import numpy as np
 from climatevis.util import util_plotly
 from climatevis.util.validation import validate_plot_parameters
 
+# Month layout of a (non-leap) year on a day-of-year axis
+_MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_MONTH_START_DOY = (1, 32, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+_MONTH_CENTER_DOY = tuple(start + 14 for start in _MONTH_START_DOY)  # 15th of each month
+
+
+def _daily_stats(series: pd.Series, names=("min", "mean", "max")):
+    """
+    Computes min, mean and/or max for each day of year of a series with NumPy reductions.
+
+    Parameters:
+    - series: pd.Series with a DatetimeIndex.
+    - names: iterable of the statistics to compute among "min", "mean" and "max".
+
+    Returns:
+    - days: int array of the days of year present in the series
+    - stats: dict of float arrays aligned with days, keyed by the requested names
+    """
+    doy = series.index.dayofyear.to_numpy()
+    values = series.to_numpy(dtype=float)
+
+    # Slot 0 is unused so that day-of-year indexes the buffers directly
+    present = np.bincount(doy, minlength=367) > 0
+
+    # NaN-initialised buffers with fmin/fmax keep all-NaN days as NaN, like pandas
+    stats = {name: np.full(367, np.nan) for name in names}
+    if "min" in stats:
+        np.fmin.at(stats["min"], doy, values)
+    if "max" in stats:
+        np.fmax.at(stats["max"], doy, values)
+    if "mean" in stats:
+        valid = ~np.isnan(values)
+        counts = np.bincount(doy[valid], minlength=367)
+        sums = np.bincount(doy[valid], weights=values[valid], minlength=367)
+        np.divide(sums, counts, out=stats["mean"], where=counts > 0)
+
+    days = np.flatnonzero(present)
+    return days, {name: arr[days] for name, arr in stats.items()}
+
+
+def _month_annotations(y):
+    """Builds the bold month labels centered in each month, anchored at height y."""
+    return [
+        dict(
+            x=day, y=y,
+            text=f"<b>{month}</b>",
+            showarrow=False,
+            xanchor="center",
+            yanchor="top",
+            font=dict(size=12),
+            bgcolor="white",
+        )
+        for month, day in zip(_MONTH_NAMES, _MONTH_CENTER_DOY)
+    ]
+
 # def annual_profile_from_df(df: pd.DataFrame, column_name: str, paper_size='A5_LANDSCAPE'):
 #     template_name = 'base'
 #     x_title="Day of Year"
 #     return annual_profile(df[column_name], template_name, paper_size, x_title, column_name)
 
-def annual_profile_daily(series: pd.Series, template_name: str, paper_size: str, x_title="Day of Year", y_title="Value", show=["max", "min", "mean"]):
+def annual_profile_daily(series: pd.Series, template_name: str, paper_size: str, x_title="Day of Year", y_title="Value", show=["max", "min", "mean"], use_webgl=False):
     """
     Plots an annual profile of a given time series with min, mean, and max values per day.
     Adds month labels at their first day positions on the x-axis.
@@ -19,6 +74,7 @@ def annual_profile_daily(series: pd.Series, template_name: str, paper_size: str,
     - x_title: str, label for the x-axis (default: "Day of Year").
     - y_title: str, label for the y-axis (custom, depends on the metric being plotted).
     - show: list of str, values to display among ['max', 'min', 'mean']. Defaults to all.
+    - use_webgl: bool, draw the lines with WebGL (Scattergl) instead of SVG (default: False).
 
     Returns:
     - Plotly Figure
@@ -31,19 +87,17 @@ def annual_profile_daily(series: pd.Series, template_name: str, paper_size: str,
         function_name="annual_profile_daily"
     )
 
-    # Convert series to DataFrame and extract day-of-year
-    df = series.to_frame(name="metric")
-    df["day_of_year"] = df.index.dayofyear
-
-    # Group by day-of-year and calculate min, mean, and max
-    daily_stats = df.groupby("day_of_year")["metric"].agg(["min", "mean", "max"])
+    # Calculate the requested min, mean, and max for each day-of-year
+    days, daily_stats = _daily_stats(series, [name for name in ("min", "mean", "max") if name in show])
 
     fig = go.Figure()
+    traces = []
+    scatter = go.Scattergl if use_webgl else go.Scatter
 
     # Add Min Line if requested
     if "min" in show:
-        fig.add_trace(go.Scatter(
-            x=daily_stats.index,
+        traces.append(scatter(
+            x=days,
             y=daily_stats["min"],
             mode='lines',
             name=f"Min {y_title}",
@@ -52,8 +106,8 @@ def annual_profile_daily(series: pd.Series, template_name: str, paper_size: str,
 
     # Add Mean Line if requested
     if "mean" in show:
-        fig.add_trace(go.Scatter(
-            x=daily_stats.index,
+        traces.append(scatter(
+            x=days,
             y=daily_stats["mean"],
             mode='lines',
             name=f"Mean {y_title}",
@@ -62,32 +116,19 @@ def annual_profile_daily(series: pd.Series, template_name: str, paper_size: str,
 
     # Add Max Line if requested
     if "max" in show:
-        fig.add_trace(go.Scatter(
-            x=daily_stats.index,
+        traces.append(scatter(
+            x=days,
             y=daily_stats["max"],
             mode='lines',
             name=f"Max {y_title}",
             line=dict(color="red")
         ))
 
-    # Compute first day-of-year for each month
-    months = pd.date_range("2023-01-01", "2023-12-31", freq="MS")  # MS = Month Start
-    month_positions = {date.strftime("%b"): date.dayofyear + 14 for date in months}  # Adjust to 15th
-
-    # Add month labels at their respective positions along the 0-line
-    for month, day in month_positions.items():
-        fig.add_annotation(
-            x=day, y=min(series),  # Align to the minimum value of the series
-            text=f"<b>{month}</b>",
-            showarrow=False,
-            xanchor="center",
-            yanchor="top",
-            font=dict(size=12),
-            bgcolor="white",
-        )
+    fig.add_traces(traces)
 
-    # Update layout
+    # Update layout, with month labels along the minimum value of the series
     fig.update_layout(
+        annotations=_month_annotations(series.min()),
         xaxis_title=x_title,
         yaxis_title=y_title,
         showlegend=False
@@ -99,7 +140,7 @@ def annual_profile_daily(series: pd.Series, template_name: str, paper_size: str,
     return fig
 
 
-def annual_profile_multiple(series_list: list, template_name: str, paper_size: str, x_title="Day of Year", y_title="Value", show='max'):
+def annual_profile_multiple(series_list: list, template_name: str, paper_size: str, x_title="Day of Year", y_title="Value", show='max', use_webgl=False):
     """
     Plots an annual profile for multiple time series for a single selected statistic.
     Adds month labels at their first day positions on the x-axis.
@@ -109,6 +150,7 @@ def annual_profile_multiple(series_list: list, template_name: str, paper_size: s
     - x_title: str, label for the x-axis (default: "Day of Year").
     - y_title: str, label for the y-axis (custom, depends on the metric being plotted).
     - show: str, one of ['max', 'min', 'mean'] indicating the statistic to display (default: 'max').
+    - use_webgl: bool, draw the lines with WebGL (Scattergl) instead of SVG (default: False).
 
     Returns:
     - Plotly Figure
@@ -121,17 +163,15 @@ def annual_profile_multiple(series_list: list, template_name: str, paper_size: s
 
     # To determine a common minimum for month labels, collect all min values
     overall_mins = []
+    traces = []
+    scatter = go.Scattergl if use_webgl else go.Scatter
 
     for i, series in enumerate(series_list):
         if not isinstance(series.index, pd.DatetimeIndex):
             raise ValueError("Each series index must be a DatetimeIndex.")
 
-        # Convert series to DataFrame and extract day-of-year
-        df = series.to_frame(name="metric")
-        df["day_of_year"] = df.index.dayofyear
-
-        # Group by day-of-year and calculate the selected statistic
-        daily_stats = df.groupby("day_of_year")["metric"].agg(show)
+        # Calculate only the selected statistic for each day-of-year
+        days, daily_stats = _daily_stats(series, (show,))
 
         # Add the statistic value for this series to overall_mins for later month label positioning
         overall_mins.append(series.min())
@@ -140,34 +180,21 @@ def annual_profile_multiple(series_list: list, template_name: str, paper_size: s
         label = series.name if series.name is not None else f"Series {i+1}"
         label = f"{label} ({show})"
 
-        fig.add_trace(go.Scatter(
-            x=daily_stats.index,
-            y=daily_stats,
+        traces.append(scatter(
+            x=days,
+            y=daily_stats[show],
             mode='lines',
             name=label
         ))
 
+    fig.add_traces(traces)
+
     # Compute overall minimum value for placing month labels
     overall_min = min(overall_mins) if overall_mins else 0
 
-    # Compute first day-of-year for each month
-    months = pd.date_range("2023-01-01", "2023-12-31", freq="MS")  # MS = Month Start
-    month_positions = {date.strftime("%b"): date.dayofyear + 14 for date in months}  # Adjust to 15th
-
-    # Add month labels at their respective positions along the overall minimum value line
-    for month, day in month_positions.items():
-        fig.add_annotation(
-            x=day, y=overall_min,
-            text=f"<b>{month}</b>",
-            showarrow=False,
-            xanchor="center",
-            yanchor="top",
-            font=dict(size=12),
-            bgcolor="white",
-        )
-
-    # Update layout
+    # Update layout, with month labels along the overall minimum value line
     fig.update_layout(
+        annotations=_month_annotations(overall_min),
         xaxis_title=x_title,
         yaxis_title=y_title,
         showlegend=True
@@ -5,7 +5,10 @@ from climatevis.util import util_plotly
 from climatevis.util.validation import validate_plot_parameters
 from typing import Union, List
 
-def cumulative_probability(series_list: Union[List[pd.Series], pd.Series], template_name: str, paper_size: str, x_title="Value", y_title="Cumulative Probability", selected_percentile=None, y_grid_spacing: int = 10):
+# Number of points the CDF curve is sampled at for large series
+_CDF_POINTS = 1024
+
+def cumulative_probability(series_list: Union[List[pd.Series], pd.Series], template_name: str, paper_size: str, x_title="Value", y_title="Cumulative Probability", selected_percentile=None, y_grid_spacing: int = 10, use_webgl=False):
     """
     Plots cumulative probability curves (CDF) for multiple series using Plotly.
 
@@ -15,6 +18,10 @@ def cumulative_probability(series_list: Union[List[pd.Series], pd.Series], templ
     - y_title: str, label for the y-axis (Cumulative Probability)
     - selected_percentile: float (0-100), percentile to highlight with a marker and annotation.
     - y_grid_spacing: int, interval for y-axis grid lines in percentage (e.g., 10, 20, 100).
+    - use_webgl: bool, draw the CDF curves with WebGL (Scattergl) instead of SVG (default: False).
+
+    Series longer than 2048 values are drawn from 1024 evenly spaced quantiles; the
+    percentile marker is always computed from the full data.
 
     Returns:
     - Plotly Figure
@@ -32,21 +39,35 @@ def cumulative_probability(series_list: Union[List[pd.Series], pd.Series], templ
         raise ValueError("cumulative_probability: y_grid_spacing must be an integer between 1 and 100")
 
     fig = go.Figure()
+    scatter = go.Scattergl if use_webgl else go.Scatter
 
     for idx, series in enumerate(validated_series):
-        sorted_values = np.sort(series)  # Sort values in ascending order
-        cumulative_probs = np.linspace(0, 1, len(series), endpoint=True)  # Probabilities from 0 to 1
+        values = series.to_numpy()
+        downsample = len(values) > 2 * _CDF_POINTS and not np.isnan(values).any()
+
+        if downsample:
+            # Sample the CDF at fixed probabilities; the points lie on the full-resolution curve
+            cumulative_probs = np.linspace(0, 1, _CDF_POINTS, endpoint=True)
+            sorted_values = np.quantile(values, cumulative_probs)
+        else:
+            sorted_values = np.sort(values)  # Sort values in ascending order
+            cumulative_probs = np.linspace(0, 1, len(series), endpoint=True)  # Probabilities from 0 to 1
 
         series_name = series.name if series.name else f"Series {idx+1}"
-        fig.add_trace(go.Scatter(x=sorted_values, y=cumulative_probs, mode='lines', name=series_name))
+        fig.add_trace(scatter(x=sorted_values, y=cumulative_probs, mode='lines', name=series_name))
 
         # Add marker if selected_percentile is specified
         if selected_percentile is not None:
             index = int(len(series) * (selected_percentile / 100))
             index = max(0, min(index, len(series) - 1))
 
-            selected_x = sorted_values[index]
-            selected_y = cumulative_probs[index]
+            if downsample:
+                # Select the exact order statistic rather than reading the sampled curve
+                selected_x = np.partition(values, index)[index]
+                selected_y = index / (len(series) - 1)
+            else:
+                selected_x = sorted_values[index]
+                selected_y = cumulative_probs[index]
 
             fig.add_trace(go.Scatter(
                 x=[selected_x],
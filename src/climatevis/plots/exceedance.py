@@ -1,10 +1,17 @@
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.colors as pc
 from climatevis.util import util_plotly
 from climatevis.util.validation import validate_plot_parameters
 
+@lru_cache(maxsize=8)
+def _exceedance_probs(n):
+    """Exceedance probabilities from 1 towards 0 for n sorted values (cached per length, read-only)."""
+    probs = 1.0 - np.arange(n, dtype=np.float64) / n
+    probs.flags.writeable = False
+    return probs
+
 def exceedance(series: pd.Series, template_name: str, paper_size: str, x_title="Exceedance Probability", y_title="", selected_percentile=None):
     """
     Plots an exceedance probability curve using Plotly.
@@ -28,11 +35,10 @@ def exceedance(series: pd.Series, template_name: str, paper_size: str, x_title="
         function_name="exceedance"
     )
 
-    sorted_values = np.sort(series)[::-1]  # Sort values in descending order
-    exceedance_probs = np.linspace(1, 0, len(series), endpoint=False)  # Probabilities from 1 to 0
+    sorted_values = _sort_desc(series)  # Sort values in descending order
+    exceedance_probs = _exceedance_probs(len(series))  # Probabilities from 1 to 0
 
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=exceedance_probs, y=sorted_values, mode='lines'))  # X-axis: 1 (left) → 0 (right)
+    traces = [go.Scatter(x=exceedance_probs, y=sorted_values, mode='lines')]  # X-axis: 1 (left) → 0 (right)
 
     # Add marker if selected_percentile is specified
     if selected_percentile is not None:
@@ -44,7 +50,7 @@ def exceedance(series: pd.Series, template_name: str, paper_size: str, x_title="
         selected_y = sorted_values[index]  # Corrected sorted value reference
 
         # Add marker at the correct exceedance probability
-        fig.add_trace(go.Scatter(
+        traces.append(go.Scatter(
             x=[selected_x],
             y=[selected_y],
             mode='markers',
@@ -52,33 +58,16 @@ def exceedance(series: pd.Series, template_name: str, paper_size: str, x_title="
             name=f"{selected_percentile}th Percentile"
         ))
 
-        if 0:
-            # Fixed annotation at (0.1, 0.9) in axis space (top-left)
-            annotation_text = (
-                f"<b>{selected_percentile}th Percentile</b><br>"
-                f"Value: {selected_y:.2f}"
-            )
-
-            fig.add_annotation(
-                x=0.1, y=0.9,  # Fixed position in figure space (top-left)
-                xref="paper", yref="paper",  # Use figure space instead of data space
-                text=annotation_text,
-                showarrow=False,
-                bgcolor="white",
-                bordercolor="black",
-                font=dict(size=12)
-            )
-
-    fig.update_layout(
-        xaxis_title=x_title,
+    layout = dict(
         yaxis_title=y_title,
         showlegend=False,
         xaxis=dict(
             autorange="reversed",  # Ensure 1 (100%) is on the left
             tickformat=".0%",  # Display exceedance probability in percentage format
-            title_standoff=5
+            title=dict(text=x_title, standoff=5)
         )
     )
+    fig = go.Figure(data=traces, layout=layout)
 
     # Apply your custom plotly template
     fig = util_plotly.apply_template_to_figure(fig, template_name=template_name, paper_size=paper_size)
@@ -86,10 +75,38 @@ def exceedance(series: pd.Series, template_name: str, paper_size: str, x_title="
     return fig
 
 
+@lru_cache(maxsize=32)
+def _band_colors(colorscale, num_bands):
+    """
+    Interpolates num_bands colors between the ends of a Plotly colorscale, as rgba strings with 20% opacity.
+    Cached, since the same colorscale and band count are typically reused across plots.
+    """
+    import plotly.colors as pc
 
-import plotly.graph_objects as go
-import numpy as np
-import plotly.colors as pc
+    colors = pc.get_colorscale(colorscale)
+    low = np.array(pc.hex_to_rgb(colors[0][1]), dtype=float)  # Convert hex colors to RGB
+    high = np.array(pc.hex_to_rgb(colors[-1][1]), dtype=float)
+
+    steps = np.arange(num_bands) / max(num_bands - 1, 1)
+    band_colors = (low + steps[:, None] * (high - low)).tolist()
+    return tuple(f"rgba({r},{g},{b},0.2)" for r, g, b in band_colors)
+
+def _sort_desc(data):
+    """Returns the data as a float array sorted in descending order (high values first)."""
+    return np.sort(np.asarray(data, dtype=np.float64))[::-1]
+
+def _band_indices(bands, total_points):
+    """
+    Converts (from_percentage, to_percentage) exceedance bands into positions in the
+    descending-sorted data for all bands at once, capped at the last point.
+
+    Returns:
+        tuple: (from_idx, to_idx) integer arrays, one entry per band.
+    """
+    percs = np.asarray(bands, dtype=np.float64).reshape(-1, 2)
+    idx = ((1 - percs) * total_points).astype(np.int64)  # Inverted, truncated like int()
+    np.minimum(idx, total_points - 1, out=idx)
+    return idx[:, 0], idx[:, 1]
 
 def add_exceedance_bands(fig, data, bands, colorscale="Viridis"):
     """
@@ -111,43 +128,33 @@ def add_exceedance_bands(fig, data, bands, colorscale="Viridis"):
     if not isinstance(fig, go.Figure):
         raise TypeError("fig must be a plotly.graph_objects.Figure instance.")
 
-    data_sorted = sorted(data, reverse=True)  # Sort descending (high values first)
+    data_sorted = _sort_desc(data)
     total_points = len(data_sorted)
 
     # Get x-axis range from first trace in figure
     if fig.data and len(fig.data) > 0:
-        x_values = fig.data[0].x
-        x_range_min = min(x_values)
-        x_range_max = max(x_values)
+        x_values = np.asarray(fig.data[0].x)
+        x_range_min = x_values.min()
+        x_range_max = x_values.max()
     else:
         x_range_min, x_range_max = 0, 1  # Default fallback
 
     # Generate colors from the selected colorscale
-    colors = pc.get_colorscale(colorscale)
-    colors_rgb = [pc.hex_to_rgb(color[1]) for color in colors]  # Convert hex colors to RGB tuples
-
-    num_bands = len(bands)
-    band_colors = [pc.find_intermediate_color(colors_rgb[0], colors_rgb[-1], i / max(num_bands - 1, 1)) for i in range(num_bands)]
+    band_colors = _band_colors(colorscale, len(bands))
+    from_indices, to_indices = _band_indices(bands, total_points)
 
+    shapes, annotations = [], []
     for i, (from_perc, to_perc) in enumerate(bands):
-        from_idx = int((1 - from_perc) * total_points)  # Inverted
-        to_idx = int((1 - to_perc) * total_points)      # Inverted
-
-        if from_idx >= total_points:
-            from_idx = total_points - 1
-        if to_idx >= total_points:
-            to_idx = total_points - 1
+        from_idx, to_idx = from_indices[i], to_indices[i]
 
         # Get actual Y-value range from sorted data
         from_value = data_sorted[to_idx]
         to_value = data_sorted[from_idx]
 
-        # Convert RGB color to rgba with transparency
-        band_color = band_colors[i]
-        band_color_rgba = f"rgba({band_color[0]},{band_color[1]},{band_color[2]},0.2)"  # 20% opacity
+        band_color_rgba = band_colors[i]
 
         # Add transparent shaded box to highlight the band
-        fig.add_shape(
+        shapes.append(dict(
             type="rect",
             x0=x_range_min,
             x1=x_range_max,
@@ -156,17 +163,23 @@ def add_exceedance_bands(fig, data, bands, colorscale="Viridis"):
             fillcolor=band_color_rgba,
             line=dict(width=0),
             layer="below",
-        )
+        ))
 
         # Add annotation for exceedance percentage
-        fig.add_annotation(
+        annotations.append(dict(
             x=(x_range_max - x_range_min)/2,
             y=(from_value + to_value) / 2,
             text=f"{from_perc*100:.1f}% - {to_perc*100:.1f}%",
             showarrow=False,
             # bgcolor=f"rgba({band_color[0]},{band_color[1]},{band_color[2]},0.5)",  # Slightly more visible
             # bordercolor="black",
-        )
+        ))
+
+    # Append all bands in one layout update, keeping any shapes/annotations already on the figure
+    fig.update_layout(
+        shapes=list(fig.layout.shapes) + shapes,
+        annotations=list(fig.layout.annotations) + annotations,
+    )
 
     return fig
 
@@ -185,29 +198,23 @@ def calculate_exceedance_summary(data, bands):
     if not bands:
         raise ValueError("Bands list cannot be empty.")
 
-    data_sorted = sorted(data, reverse=True)  # Sort descending (high values first)
+    data_sorted = _sort_desc(data)
     total_points = len(data_sorted)
 
     summary_data = []
+    from_indices, to_indices = _band_indices(bands, total_points)
 
-    for from_perc, to_perc in bands:
-        from_idx = int((1 - from_perc) * total_points)  # Inverted
-        to_idx = int((1 - to_perc) * total_points)      # Inverted
-
-        if from_idx >= total_points:
-            from_idx = total_points - 1
-        if to_idx >= total_points:
-            to_idx = total_points - 1
-
-        # Get values in the exceedance range
+    for (from_perc, to_perc), from_idx, to_idx in zip(bands, from_indices, to_indices):
+        # Get values in the exceedance range (a view of the sorted array). Each band is
+        # reduced on its own, so a NaN only affects the band that holds it.
         band_values = data_sorted[to_idx:from_idx+1]
 
-        # Compute statistics
+        # Compute statistics; the band is sorted descending, so its ends are the max and min
         count_in_band = len(band_values)
         percent_in_band = (count_in_band / total_points) * 100
-        min_value = min(band_values) if band_values else None
-        max_value = max(band_values) if band_values else None
-        mean_value = sum(band_values) / count_in_band if count_in_band > 0 else None
+        min_value = band_values[-1] if count_in_band > 0 else None
+        max_value = band_values[0] if count_in_band > 0 else None
+        mean_value = band_values.mean() if count_in_band > 0 else None
 
         summary_data.append({
             "From %": from_perc * 100,
@@ -236,13 +243,13 @@ def calculate_value_range_summary(data, value_bands):
     if not value_bands:
         raise ValueError("Value bands list cannot be empty.")
 
-    total_points = len(data)
+    values = np.asarray(data, dtype=np.float64)
+    total_points = len(values)
 
     # Handle case where dataset is empty
     if total_points == 0:
         return pd.DataFrame(columns=["Band", "Count", "Percentage", "Min", "Max", "Mean"])
 
-    data_min, data_max = min(data), max(data)  # Find data range
     summary_data = []
 
     for band in value_bands:
@@ -256,20 +263,21 @@ def calculate_value_range_summary(data, value_bands):
 
         # Select data based on band conditions
         if is_upper_band:
-            band_values = [x for x in data if x >= min_val]
+            mask = values >= min_val
             band_label = f"> {min_val}"
         elif is_lower_band:
-            band_values = [x for x in data if x < max_val]
+            mask = values < max_val
             band_label = f"< {max_val}"
         else:
-            band_values = [x for x in data if min_val <= x < max_val]
+            mask = (values >= min_val) & (values < max_val)
             band_label = f"{min_val} - {max_val}"
 
+        band_values = values[mask]
         count_in_band = len(band_values)
         percent_in_band = (count_in_band / total_points) * 100 if total_points > 0 else 0
-        min_value = min(band_values) if band_values else None
-        max_value = max(band_values) if band_values else None
-        mean_value = sum(band_values) / count_in_band if count_in_band > 0 else None
+        min_value = band_values.min() if count_in_band > 0 else None
+        max_value = band_values.max() if count_in_band > 0 else None
+        mean_value = band_values.mean() if count_in_band > 0 else None
 
         summary_data.append({
             "Band": band_label,
@@ -308,21 +316,19 @@ def add_value_range_bands(fig, data, value_bands, colorscale="Viridis"):
 
     # Get x-axis range from first trace in figure
     if fig.data and len(fig.data) > 0:
-        x_values = fig.data[0].x
-        x_range_min = min(x_values)
-        x_range_max = max(x_values)
+        x_values = np.asarray(fig.data[0].x)
+        x_range_min = x_values.min()
+        x_range_max = x_values.max()
     else:
         x_range_min, x_range_max = 0, 1  # Default fallback
 
-    data_min, data_max = min(data), max(data)  # Get actual data range
+    values = np.asarray(data, dtype=np.float64)
+    data_min, data_max = values.min(), values.max()  # Get actual data range
 
     # Generate colors from the selected colorscale
-    colors = pc.get_colorscale(colorscale)
-    colors_rgb = [pc.hex_to_rgb(color[1]) for color in colors]  # Convert hex colors to RGB tuples
-
-    num_bands = len(value_bands)
-    band_colors = [pc.find_intermediate_color(colors_rgb[0], colors_rgb[-1], i / max(num_bands - 1, 1)) for i in range(num_bands)]
+    band_colors = _band_colors(colorscale, len(value_bands))
 
+    shapes, annotations = [], []
     for i, band in enumerate(value_bands):
         # Detect open-ended bands
         if isinstance(band, tuple) and len(band) == 2:
@@ -334,25 +340,23 @@ def add_value_range_bands(fig, data, value_bands, colorscale="Viridis"):
 
         # Select data points inside this band
         if is_upper_band:
-            band_values = [x for x in data if x >= min_val]
+            mask = values >= min_val
             y0, y1 = min_val, data_max  # Top band snaps to data_max
         elif is_lower_band:
-            band_values = [x for x in data if x < max_val]
+            mask = values < max_val
             y0, y1 = data_min, max_val  # Bottom band snaps to data_min
         else:
-            band_values = [x for x in data if min_val <= x < max_val]
+            mask = (values >= min_val) & (values < max_val)
             y0, y1 = min_val, max_val  # Normal case
 
         # **Skip plotting if the band has no data**
-        if not band_values:
+        if not mask.any():
             continue  # Skip this band
 
-        # Convert RGB color to rgba with transparency
-        band_color = band_colors[i]
-        band_color_rgba = f"rgba({band_color[0]},{band_color[1]},{band_color[2]},0.2)"  # 20% opacity
+        band_color_rgba = band_colors[i]
 
         # Add vertical shaded box to highlight the band
-        fig.add_shape(
+        shapes.append(dict(
             type="rect",
             x0=x_range_min,
             x1=x_range_max,
@@ -361,104 +365,22 @@ def add_value_range_bands(fig, data, value_bands, colorscale="Viridis"):
             fillcolor=band_color_rgba,
             line=dict(width=0),
             layer="below",
-        )
+        ))
 
         # Add annotation for the band
-        fig.add_annotation(
+        annotations.append(dict(
             x=(x_range_max-x_range_min)/2,
             y=(y0 + y1) / 2,
             text=f"{y0} to {y1}" if not is_upper_band and not is_lower_band else (f"> {y0}" if is_upper_band else f"< {y1}"),
             showarrow=False,
             # bgcolor=f"rgba({band_color[0]},{band_color[1]},{band_color[2]},0.5)",  # Slightly more visible
             # bordercolor="black",
-        )
-
-    return fig
-
-
-
-
-def add_value_range_bands_OLD2(fig, data, value_bands, colorscale="Viridis"):
-    """
-    Adds vertical bands to a Plotly figure based on specific value ranges,
-    including open-ended bands (> or <).
-
-    Parameters:
-        fig (plotly.graph_objects.Figure): The existing Plotly figure.
-        data (list or numpy array): The dataset (Y-values) to calculate exceedances.
-        value_bands (list of tuples): List of (min_value, max_value) or ("> value", "< value") for open-ended bands.
-        colorscale (str, optional): The Plotly color scale to use for automatic band colors (default: "Viridis").
-
-    Returns:
-        plotly.graph_objects.Figure: Updated figure with vertical exceedance bands.
-    """
-    if not value_bands:
-        raise ValueError("Value bands list cannot be empty.")
-
-    if not isinstance(fig, go.Figure):
-        raise TypeError("fig must be a plotly.graph_objects.Figure instance.")
-
-    # Get x-axis range from first trace in figure
-    if fig.data and len(fig.data) > 0:
-        x_values = fig.data[0].x
-        x_range_min = min(x_values)
-        x_range_max = max(x_values)
-    else:
-        x_range_min, x_range_max = 0, 1  # Default fallback
-
-    data_min, data_max = min(data), max(data)  # Get actual data range
-
-    # Generate colors from the selected colorscale
-    colors = pc.get_colorscale(colorscale)
-    colors_rgb = [pc.hex_to_rgb(color[1]) for color in colors]  # Convert hex colors to RGB tuples
-
-    num_bands = len(value_bands)
-    band_colors = [pc.find_intermediate_color(colors_rgb[0], colors_rgb[-1], i / max(num_bands - 1, 1)) for i in range(num_bands)]
-
-    for i, band in enumerate(value_bands):
-        # Detect open-ended bands
-        if isinstance(band, tuple) and len(band) == 2:
-            min_val, max_val = band
-            is_upper_band = max_val is None  # e.g., (50, None) means y > 50
-            is_lower_band = min_val is None  # e.g., (None, 10) means y < 10
-        else:
-            raise ValueError("Bands must be tuples (min_value, max_value) or (None, value) for open-ended bands.")
-
-        # Adjust y0, y1 for open-ended bands
-        if is_upper_band:
-            y0, y1 = min_val, data_max  # Top band snaps to data_max
-        elif is_lower_band:
-            y0, y1 = data_min, max_val  # Bottom band snaps to data_min
-        else:
-            y0, y1 = min_val, max_val  # Normal case
-
-        if not band_values:
-            continue # Skip empty bands
-
-        # Convert RGB color to rgba with transparency
-        band_color = band_colors[i]
-        band_color_rgba = f"rgba({band_color[0]},{band_color[1]},{band_color[2]},0.2)"  # 20% opacity
-
-        # Add vertical shaded box to highlight the band
-        fig.add_shape(
-            type="rect",
-            x0=x_range_min,
-            x1=x_range_max,
-            y0=y0,
-            y1=y1,
-            fillcolor=band_color_rgba,
-            line=dict(width=0),
-            layer="below",
-        )
+        ))
 
-        # Add annotation for the band
-        fig.add_annotation(
-            x=(x_range_max-x_range_min)/2,
-            y=(y0 + y1) / 2,
-            text=f"{y0} to {y1}" if not is_upper_band and not is_lower_band else (f"> {y0}" if is_upper_band else f"< {y1}"),
-            showarrow=False,
-            # bgcolor=f"rgba({band_color[0]},{band_color[1]},{band_color[2]},0.5)",  # Slightly more visible
-            # bordercolor="black",
-        )
+    # Append all bands in one layout update, keeping any shapes/annotations already on the figure
+    fig.update_layout(
+        shapes=list(fig.layout.shapes) + shapes,
+        annotations=list(fig.layout.annotations) + annotations,
+    )
 
     return fig
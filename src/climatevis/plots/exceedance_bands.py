@@ -1,11 +1,11 @@
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.colors as pc
 from climatevis.util import util_plotly
 from climatevis.util.validation import validate_plot_parameters
+from climatevis.plots.exceedance import _exceedance_probs
 
-def exceedance_bands(series_list: list, template_name: str, paper_size: str, x_title="Exceedance Probability", y_title="", selected_percentile=None):
+def exceedance_bands(series_list: list, template_name: str, paper_size: str, x_title="Exceedance Probability", y_title="", selected_percentile=None, max_points=20000):
     """
     Plots exceedance probability curves for multiple series using Plotly.
 
@@ -16,6 +16,8 @@ def exceedance_bands(series_list: list, template_name: str, paper_size: str, x_t
     - x_title: str, label for the x-axis (Exceedance Probability)
     - y_title: str, label for the y-axis (Sorted Values)
     - selected_percentile: float (0-100), percentile to highlight with a marker and annotation.
+    - max_points: int, curves of longer series are thinned to about this many points for display;
+      the percentile marker still uses every value (default: 20000).
 
     Returns:
     - Plotly Figure
@@ -28,17 +30,23 @@ def exceedance_bands(series_list: list, template_name: str, paper_size: str, x_t
         function_name="exceedance_bands"
     )
 
-    fig = go.Figure()
-
+    traces = []
     for series in validated_series:
         series_label = series.name if series.name else "Unnamed Series"
-        print(series.name)
-        sorted_values = np.sort(series)[::-1]  # Sort values in descending order
-        exceedance_probs = np.linspace(1, 0, len(series), endpoint=False)  # Probabilities from 1 to 0
+        values = np.ascontiguousarray(series.to_numpy(), dtype=np.float64)
+        sorted_values = np.sort(values)[::-1]  # Sort values in descending order
+        exceedance_probs = _exceedance_probs(len(values))  # Probabilities from 1 to 0
+
+        # Thin long curves with a fixed stride, always keeping the last (lowest) point
+        if len(values) > max_points:
+            stride = len(values) // max_points
+            shown = np.append(np.arange(0, len(values) - 1, stride), len(values) - 1)
+        else:
+            shown = slice(None)
 
-        fig.add_trace(go.Scatter(
-            x=exceedance_probs,
-            y=sorted_values,
+        traces.append(go.Scatter(
+            x=exceedance_probs[shown],
+            y=sorted_values[shown],
             mode='lines',
             name=series_label
         ))
@@ -50,7 +58,7 @@ def exceedance_bands(series_list: list, template_name: str, paper_size: str, x_t
             selected_x = exceedance_probs[index]
             selected_y = sorted_values[index]
 
-            fig.add_trace(go.Scatter(
+            traces.append(go.Scatter(
                 x=[selected_x],
                 y=[selected_y],
                 mode='markers',
@@ -58,8 +66,7 @@ def exceedance_bands(series_list: list, template_name: str, paper_size: str, x_t
                 name=f"{selected_percentile}th Percentile ({series_label})"
             ))
 
-    fig.update_layout(
-        xaxis_title=x_title,
+    layout = dict(
         yaxis_title=y_title,
         showlegend=True,
         legend=dict(
@@ -74,9 +81,10 @@ def exceedance_bands(series_list: list, template_name: str, paper_size: str, x_t
         xaxis=dict(
             autorange="reversed",
             tickformat=".0%",
-            title_standoff=5
+            title=dict(text=x_title, standoff=5)
         )
     )
+    fig = go.Figure(data=traces, layout=layout)
 
     # Apply your custom plotly template
     fig = util_plotly.apply_template_to_figure(fig, template_name=template_name, paper_size=paper_size)
@@ -1,5 +1,5 @@
+import numpy as np
 import pandas as pd
-import plotly.express as px
 from climatevis.util import util_plotly
 from climatevis.util.validation import validate_plot_parameters
 
@@ -24,19 +24,24 @@ def histogram(series: pd.Series, template_name: str, paper_size: str, num_bins=N
         function_name="histogram"
     )
 
+    # Extract the valid values once and reuse them for binning, statistics and plotting
+    values = series.dropna().to_numpy()
+
     if num_bins is None:
-        num_bins = int(max(series) - min(series) + 1)  # Auto binning heuristic
+        num_bins = int(np.ptp(values) + 1)  # Auto binning heuristic
 
     # Compute statistics
-    mean_value = series.mean()
-    mode_value = series.mode()[0] if not series.mode().empty else None  # Handle empty mode case
-    std_dev = series.std()
+    mean_value = values.mean()
+    mode_series = series.mode()
+    mode_value = mode_series.iat[0] if len(mode_series) > 0 else None  # Handle empty mode case
+    std_dev = values.std(ddof=1)
 
-    # Create histogram
-    fig = px.histogram(series,
-                       x=series,
+    # Create histogram (plotly.express is imported lazily, it is slow to load).
+    # Label the values with the series name like plotly does for a Series; unnamed series keep "x".
+    import plotly.express as px
+    fig = px.histogram(x=values,
                        nbins=num_bins,
-                       labels={x_title: x_title})
+                       labels={"x": str(series.name)} if series.name is not None else None)
 
     fig.update_layout(
         xaxis_title=x_title,
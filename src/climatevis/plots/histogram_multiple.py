@@ -1,5 +1,5 @@
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from climatevis.util import util_plotly
 from climatevis.util.validation import validate_plot_parameters
@@ -12,7 +12,7 @@ def multiple_histograms(series_list, template_name: str, paper_size: str, num_bi
     - series_list: List of pd.Series containing the values to plot
     - template_name: str, name of the Plotly template to use
     - paper_size: str, size of the paper (used for template styling)
-    - num_bins: int, number of bins (optional, defaults to range-based heuristic)
+    - num_bins: int, number of bins shared by all series (optional, defaults to range-based heuristic)
     - x_title: str, label for the x-axis
     - y_title: str, label for the y-axis (default: "Count")
 
@@ -27,27 +27,37 @@ def multiple_histograms(series_list, template_name: str, paper_size: str, num_bi
         function_name="multiple_histograms"
     )
 
-    fig = go.Figure()
+    # Extract the valid values of each series once
+    series_values = [series.dropna().to_numpy() for series in validated_series]
+    all_values = np.concatenate(series_values)
 
-    # Iterate over each series to add as a histogram
-    for i, series in enumerate(validated_series):
-        # Auto binning heuristic if not specified
-        if num_bins is None:
-            num_bins = int(series.max() - series.min() + 1)
+    # Auto binning heuristic if not specified, applied to the combined range so that
+    # all overlaid histograms share the same bin edges
+    if num_bins is None:
+        num_bins = int(np.ptp(all_values) + 1)
+    bin_edges = np.histogram_bin_edges(all_values, bins=num_bins)
+    xbins = dict(start=float(bin_edges[0]), end=float(bin_edges[-1]), size=float(bin_edges[1] - bin_edges[0]))
+    bin_centers = 0.5 * (bin_edges[:-1] + bin_edges[1:])
 
+    # Iterate over each series to add as a histogram
+    traces, annotations = [], []
+    for i, (series, values) in enumerate(zip(validated_series, series_values)):
         # Compute statistics
-        mean_value = series.mean()
-        mode_series = series.mode()
-        mode_value = mode_series.iloc[0] if len(mode_series) > 0 else None
-        std_dev = series.std()
+        mean_value = values.mean()
+        unique_values, unique_counts = np.unique(values, return_counts=True)  # Sorted, so ties keep the smallest mode
+        mode_value = unique_values[np.argmax(unique_counts)] if len(unique_values) > 0 else None
+        std_dev = values.std(ddof=1)
 
-        # Add histogram trace
-        fig.add_trace(go.Histogram(
-            x=series,
+        # Bin in NumPy and send only the per-bin probabilities; the histogram trace sums
+        # one pre-computed value per bin instead of binning the raw data in the browser
+        counts, _ = np.histogram(values, bins=bin_edges)
+        traces.append(go.Histogram(
+            x=bin_centers,
+            y=counts / max(len(values), 1),  # Normalized to probability
+            histfunc='sum',
             name=series.name,
-            nbinsx=num_bins,
+            xbins=xbins,
             opacity=0.75,
-            histnorm='probability',  # Normalized to probability
             marker=dict(line=dict(width=1))
         ))
 
@@ -60,7 +70,7 @@ def multiple_histograms(series_list, template_name: str, paper_size: str, num_bi
         )
 
         # Add annotation to the plot (top-right corner)
-        fig.add_annotation(
+        annotations.append(dict(
             x=0.95, y=0.95 - 0.1 * i,  # Adjust y position for each series
             xref="paper", yref="paper",
             text=annotation_text,
@@ -68,17 +78,19 @@ def multiple_histograms(series_list, template_name: str, paper_size: str, num_bi
             bgcolor="white",
             bordercolor="black",
             font=dict(size=12)
-        )
+        ))
 
-    # Update layout for better visualization
-    fig.update_layout(
+    # Build the figure with its layout in one step
+    layout = dict(
         # title="Multiple Histograms with Statistics",
+        annotations=annotations,
         xaxis_title=x_title,
         yaxis_title=y_title,
         barmode='overlay',
         template=template_name,
         legend=dict(title="Series", orientation="h", x=0.5, xanchor='center'),
     )
+    fig = go.Figure(data=traces, layout=layout)
 
     fig = util_plotly.apply_template_to_figure(fig, template_name=template_name, paper_size=paper_size)
 
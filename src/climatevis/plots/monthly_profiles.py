@@ -4,6 +4,44 @@ import numpy as np
 from climatevis.util import util_plotly
 from climatevis.util.validation import validate_plot_parameters
 
+# x position of every (month, hour) slot, shifting each month into its own 24-hour "day"
+_MONTH_HOUR_X = np.arange(12 * 24).reshape(12, 24)
+
+
+def _month_hour_stats(series: pd.Series):
+    """
+    Computes min, mean and max for each (month, hour) slot of a series in a single pass.
+
+    Each timestamp is mapped to a flat key ``(month - 1) * 24 + hour``; the values are
+    sorted by key once and reduced per slot with NaN-aware ufuncs.
+
+    Returns:
+    - present: bool array of shape (12, 24), True where the series has timestamps
+    - stats: dict of float arrays of shape (12, 24) keyed by "min", "mean" and "max"
+    """
+    idx = series.index
+    keys = (idx.month.to_numpy() - 1) * 24 + idx.hour.to_numpy()
+    values = series.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+
+    order = np.argsort(keys, kind="stable")
+    slots, starts = np.unique(keys[order], return_index=True)
+    sorted_values = values[order]
+
+    stats = {name: np.full(12 * 24, np.nan) for name in ("min", "mean", "max")}
+    if len(slots):
+        stats["min"][slots] = np.fmin.reduceat(sorted_values, starts)
+        stats["max"][slots] = np.fmax.reduceat(sorted_values, starts)
+
+    counts = np.bincount(keys[valid], minlength=12 * 24)
+    sums = np.bincount(keys[valid], weights=values[valid], minlength=12 * 24)
+    np.divide(sums, counts, out=stats["mean"], where=counts > 0)
+
+    present = np.zeros(12 * 24, dtype=bool)
+    present[slots] = True
+    return present.reshape(12, 24), {name: arr.reshape(12, 24) for name, arr in stats.items()}
+
+
 def monthly_profiles(series: pd.Series, template_name: str, paper_size: str, x_title="Hour of Day", y_title="Value"):
     """
     Plots a daily profile for each month, where each month has a separate 24-hour day.
@@ -25,58 +63,34 @@ def monthly_profiles(series: pd.Series, template_name: str, paper_size: str, x_t
         function_name="monthly_profiles"
     )
 
-    # Convert series to DataFrame and extract month + hour
-    df = series.to_frame(name="metric")
-    df["month"] = df.index.month
-    df["hour"] = df.index.hour
-
-    # Group by month and hour to compute min, mean, and max
-    hourly_stats = df.groupby(["month", "hour"])["metric"].agg(["min", "mean", "max"]).reset_index()
-
-    fig = go.Figure()
+    # Compute min, mean, and max for every month and hour in a single pass
+    present, stats = _month_hour_stats(series)
 
     # Define month names (to align with x-axis)
     month_labels = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
 
-    # Shift x-axis positions so that each month gets its own 24-hour "day"
-    for i, month in enumerate(range(1, 13)):  # Loop through months 1-12
-        month_data = hourly_stats[hourly_stats["month"] == month]
-        shifted_x = month_data["hour"] + (i * 24)  # Offset each month's data on x-axis
-
-        # Add Min Line
-        fig.add_trace(go.Scatter(
-            x=shifted_x,
-            y=month_data["min"],
-            mode='lines',
-            name=f"{month_labels[i]} Min",
-            line=dict(color="blue"),
-            showlegend=(i == 0)  # Show legend only once
-        ))
-
-        # Add Mean Line
-        fig.add_trace(go.Scatter(
-            x=shifted_x,
-            y=month_data["mean"],
-            mode='lines',
-            name=f"{month_labels[i]} Mean",
-            line=dict(color="black", dash="dot"),
-            showlegend=(i == 0)  # Show legend only once
-        ))
-
-        # Add Max Line
-        fig.add_trace(go.Scatter(
-            x=shifted_x,
-            y=month_data["max"],
-            mode='lines',
-            name=f"{month_labels[i]} Max",
-            line=dict(color="red"),
-            showlegend=(i == 0)  # Show legend only once
-        ))
+    # Lay the months end to end, each in its own 24-hour "day", keeping only the hours with
+    # data and ending every month with a NaN so each statistic draws as one broken line
+    keep = np.ones((12, 25), dtype=bool)
+    keep[:, :24] = present
+
+    def month_segments(month_hour_values):
+        padded = np.full((12, 25), np.nan)
+        padded[:, :24] = month_hour_values
+        return padded[keep][:-1]  # No separator needed after December
+
+    x = month_segments(_MONTH_HOUR_X)
+    traces = [
+        go.Scatter(x=x, y=month_segments(stats["min"]), mode='lines', name="Min", line=dict(color="blue")),
+        go.Scatter(x=x, y=month_segments(stats["mean"]), mode='lines', name="Mean", line=dict(color="black", dash="dot")),
+        go.Scatter(x=x, y=month_segments(stats["max"]), mode='lines', name="Max", line=dict(color="red")),
+    ]
 
     # Add month labels centered at each day's position
-    for i, month in enumerate(month_labels):
-        fig.add_annotation(
-            x=(i * 24) + 12, y=min(series),  # Centered in each month's 24-hour block
+    y_anchor = np.nanmin(stats["min"])  # Overall minimum, from the 288 month/hour minima
+    annotations = [
+        dict(
+            x=(i * 24) + 12, y=y_anchor,  # Centered in each month's 24-hour block
             text=f"<b>{month}</b>",
             showarrow=False,
             xanchor="center",
@@ -86,9 +100,12 @@ def monthly_profiles(series: pd.Series, template_name: str, paper_size: str, x_t
             # bordercolor="black",
             # borderwidth=1
         )
+        for i, month in enumerate(month_labels)
+    ]
 
-    # Update layout
-    fig.update_layout(
+    # Build the figure with its layout in one step
+    layout = dict(
+        annotations=annotations,
         xaxis_title=x_title,
         yaxis_title=y_title,
         # showlegend=True,
@@ -106,8 +123,8 @@ def monthly_profiles(series: pd.Series, template_name: str, paper_size: str, x_t
             showticklabels=False,
         ),
         showlegend=False
-
     )
+    fig = go.Figure(data=traces, layout=layout)
 
     # Apply custom template
     fig = util_plotly.apply_template_to_figure(fig, template_name=template_name, paper_size=paper_size)
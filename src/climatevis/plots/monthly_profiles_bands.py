@@ -1,11 +1,34 @@
+from functools import lru_cache
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 from climatevis.util import util_plotly
 from climatevis.util.validation import validate_plot_parameters
-import matplotlib.colors as mcolors
+from climatevis.plots.monthly_profiles import _MONTH_HOUR_X, _month_hour_stats
 # import plotly.colors as pc
 
+@lru_cache(maxsize=64)
+def _adjust_alpha(color: str, alpha=0.1):
+    """Converts a color to an rgba string with the given alpha (cached, color parsing is slow)."""
+    import matplotlib.colors as mcolors  # Deferred so importing the plots does not load matplotlib
+
+    try:
+        rgb = mcolors.to_rgb(color)
+        rgba_str = f"rgba({int(rgb[0]*255)}, {int(rgb[1]*255)}, {int(rgb[2]*255)}, {alpha})"
+        return rgba_str
+    except ValueError:
+        # Fallback to a safe color if the input color is invalid
+        return f"rgba(0, 123, 255, {alpha})"
+
+
+def _split_by_gaps(hours):
+    """Splits a sorted array of hours into segments wherever consecutive hours are more than 1 apart."""
+    if len(hours) == 0:
+        return []
+
+    return np.split(hours, np.flatnonzero(np.diff(hours) > 1) + 1)
+
+
 def monthly_profiles_bands(series_list: list, template_name: str, paper_size: str, x_title="Hour of Day", y_title="Value"):
     """
     Plots daily profiles for each month for multiple series.
@@ -22,16 +45,6 @@ def monthly_profiles_bands(series_list: list, template_name: str, paper_size: st
     Returns:
     - Plotly Figure
     """
-
-    def adjust_alpha(color: str, alpha=0.1):
-        try:
-            rgb = mcolors.to_rgb(color)
-            rgba_str = f"rgba({int(rgb[0]*255)}, {int(rgb[1]*255)}, {int(rgb[2]*255)}, {alpha})"
-            return rgba_str
-        except ValueError:
-            # Fallback to a safe color if the input color is invalid
-            return f"rgba(0, 123, 255, {alpha})"
-
     fig = go.Figure()
     month_labels = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
 
@@ -40,6 +53,7 @@ def monthly_profiles_bands(series_list: list, template_name: str, paper_size: st
         "mean": "#000000", # Solid Black (hex format)
         "max": "#ff0000"   # Solid Red (hex format)
     }
+    default_fill = _adjust_alpha(default_colors["min"], alpha=0.2)
 
     # Validate inputs using the validation utility
     validated_series = validate_plot_parameters(
@@ -49,63 +63,46 @@ def monthly_profiles_bands(series_list: list, template_name: str, paper_size: st
         function_name="monthly_profiles_bands"
     )
 
-    for series in validated_series:
-
-        series_label = series.name if series.name else "Unnamed Series"
-        color = series.attrs.get('color', None)
-        # print(color)
-
-        # print(f"{color}, {color.strip('rgba()').split(',')}")
-        # rgb_value = pc.convert_to_RGB_255(color)
-        # print(f"{color}, {color.strip('rgba()').split(',')}, {rgb_value}")
+    # Buffers for the band outlines (at most 24 hours forwards and back per segment).
+    # Plotly copies array data into its traces, so they can be reused for every segment.
+    band_x = np.empty(2 * 24, dtype=_MONTH_HOUR_X.dtype)
+    band_y = np.empty(2 * 24)
 
-        # Determine fill color based on the line color
-        fill_color = adjust_alpha(color if color else default_colors["min"], alpha=0.2)
+    # Collect all traces and add them to the figure in a single call
+    traces = []
 
-        print(fill_color)
-        # Convert series to DataFrame and extract month + hour
-        df = series.to_frame(name="metric")
-        df["month"] = df.index.month
-        df["hour"] = df.index.hour
-
-        # Group by month and hour to compute min, mean, and max
-        hourly_stats = df.groupby(["month", "hour"])["metric"].agg(["min", "mean", "max"]).reset_index()
-
-        # Function to split data by gaps
-        def split_series_by_gaps(data, time_col, value_col):
-            split_data = []
-            current_segment = []
-
-            for i in range(len(data)):
-                if i > 0 and (data[time_col].iloc[i] - data[time_col].iloc[i-1]) > 1:
-                    split_data.append(current_segment)
-                    current_segment = []
-                current_segment.append((data[time_col].iloc[i], data[value_col].iloc[i]))
-
-            if current_segment:
-                split_data.append(current_segment)
-
-            return split_data
-
-        # Shift x-axis positions so that each month gets its own 24-hour "day"
-        for i, month in enumerate(range(1, 13)):  # Loop through months 1-12
-            month_data = hourly_stats[hourly_stats["month"] == month]
-            shifted_x = month_data["hour"] + (i * 24)  # Offset each month's data on x-axis
-
-            # Split Min and Max Series by gaps for shaded area
-            min_splits = split_series_by_gaps(month_data, "hour", "min")
-            max_splits = split_series_by_gaps(month_data, "hour", "max")
+    for series in validated_series:
 
-            for min_segment, max_segment in zip(min_splits, max_splits):
-                min_x, min_y = zip(*min_segment)
-                max_x, max_y = zip(*max_segment)
-                min_x = np.array(min_x) + (i * 24)
-                max_x = np.array(max_x) + (i * 24)
+        series_label = series.name if series.name else "Unnamed Series"
+        color = series.attrs.get('color')
+
+        # Resolve line colors and the fill color (based on the line color) once per series
+        min_color = color or default_colors["min"]
+        mean_color = color or default_colors["mean"]
+        max_color = color or default_colors["max"]
+        fill_color = _adjust_alpha(color, alpha=0.2) if color else default_fill
+
+        # Compute min, mean, and max for every (month, hour) slot
+        present, stats = _month_hour_stats(series)
+
+        for i in range(12):  # Loop through months (0 = Jan)
+            # Split the month's hours at gaps once; all statistics share the same segments
+            segments = _split_by_gaps(np.flatnonzero(present[i]))
+            month_x = _MONTH_HOUR_X[i]
+            month_min, month_mean, month_max = stats["min"][i], stats["mean"][i], stats["max"][i]
+
+            for hours in segments:
+                # Band outline: Min forwards, then Max backwards, written into the reused buffers
+                n = len(hours)
+                np.take(month_x, hours, out=band_x[:n])
+                np.take(month_x, hours[::-1], out=band_x[n:2 * n])
+                np.take(month_min, hours, out=band_y[:n])
+                np.take(month_max, hours[::-1], out=band_y[n:2 * n])
 
                 # Fill area between Min and Max with dynamic transparency
-                fig.add_trace(go.Scatter(
-                    x=np.concatenate([min_x, max_x[::-1]]),
-                    y=np.concatenate([min_y, max_y[::-1]]),
+                traces.append(go.Scatter(
+                    x=band_x[:2 * n],
+                    y=band_y[:2 * n],
                     fill='toself',
                     mode='lines',
                     fillcolor=fill_color,
@@ -115,67 +112,61 @@ def monthly_profiles_bands(series_list: list, template_name: str, paper_size: st
                 ))
 
             # Plot Min Series
-            for segment in min_splits:
-                seg_x, seg_y = zip(*segment)
-                seg_x = np.array(seg_x) + (i * 24)
-
-                fig.add_trace(go.Scatter(
-                    x=seg_x,
-                    y=seg_y,
+            for hours in segments:
+                traces.append(go.Scatter(
+                    x=month_x[hours],
+                    y=month_min[hours],
                     mode='lines',
                     name=f"{month_labels[i]} Min ({series_label})",
-                    line=dict(color=color if color else default_colors["min"], dash="dash"),
+                    line=dict(color=min_color, dash="dash"),
                     showlegend=(i == 0)
                 ))
 
             # Plot Mean Series
-            mean_splits = split_series_by_gaps(month_data, "hour", "mean")
-            for segment in mean_splits:
-                seg_x, seg_y = zip(*segment)
-                seg_x = np.array(seg_x) + (i * 24)
-
-                fig.add_trace(go.Scatter(
-                    x=seg_x,
-                    y=seg_y,
+            for hours in segments:
+                traces.append(go.Scatter(
+                    x=month_x[hours],
+                    y=month_mean[hours],
                     mode='lines',
                     name=f"{month_labels[i]} Mean ({series_label})",
-                    line=dict(color=color if color else default_colors["mean"], dash="dot"),
+                    line=dict(color=mean_color, dash="dot"),
                     showlegend=(i == 0)
                 ))
 
             # Plot Max Series
-            for segment in max_splits:
-                seg_x, seg_y = zip(*segment)
-                seg_x = np.array(seg_x) + (i * 24)
-
-                fig.add_trace(go.Scatter(
-                    x=seg_x,
-                    y=seg_y,
+            for hours in segments:
+                traces.append(go.Scatter(
+                    x=month_x[hours],
+                    y=month_max[hours],
                     mode='lines',
                     name=f"{month_labels[i]} Max ({series_label})",
-                    line=dict(color=color if color else default_colors["max"]),
+                    line=dict(color=max_color),
                     showlegend=(i == 0)
                 ))
 
-    # Add month labels centered at each day's position
-    for i, month in enumerate(month_labels):
-        fig.add_annotation(
-            x=(i * 24) + 12, y=min(series),  # Centered in each month's 24-hour block
+    fig.add_traces(traces)
+
+    # Month labels centered in each month's 24-hour block, below the lowest value of any series
+    y_anchor = min(series.min() for series in validated_series)
+    month_annotations = [
+        dict(
+            x=(i * 24) + 12, y=y_anchor,
             text=f"<b>{month}</b>",
             showarrow=False,
             xanchor="center",
             yanchor="top",
             font=dict(size=12),
             bgcolor="white",
-            # bordercolor="black",
-            # borderwidth=1
         )
+        for i, month in enumerate(month_labels)
+    ]
 
     # Update layout with legend at the top right
     fig.update_layout(
         xaxis_title=x_title,
         yaxis_title=y_title,
         showlegend=False,
+        annotations=month_annotations,
         legend=dict(
             x=0.99,
             y=0.99,
@@ -1,14 +1,17 @@
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 from ..util import util_plotly
 from ..util.validation import validate_plot_parameters
 
-import logging
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Trace class, fixed trace arguments and whether the line dash style applies, per plot mode
+_MODE_TRACES = {
+    "line": (go.Scattergl, {"mode": "lines"}, True),
+    "area": (go.Scattergl, {"mode": "lines", "fill": "tozeroy"}, True),
+    "bar": (go.Bar, {}, False),
+    "stackedbar": (go.Bar, {}, False),
+    "markers": (go.Scattergl, {"mode": "markers"}, False),
+}
 
 def plot_timeseries_df(df, **kwargs):
     """
@@ -29,8 +32,8 @@ def plot_timeseries_df(df, **kwargs):
     if len(df.columns) == 0:
         raise ValueError("plot_timeseries_df: DataFrame must have at least one column.")
 
-    # Create series list with proper names
-    series_list = [df[col].rename(col) for col in df.columns]
+    # Columns already come out named after their labels, so no rename copy is needed
+    series_list = [series for _, series in df.items()]
     return plot_series(series_list, **kwargs)
 
 def plot_series(series_list, template_name='base', paper_size='A4_LANDSCAPE', y1_axis_title="", mode="line", show_days=False):
@@ -45,6 +48,9 @@ def plot_series(series_list, template_name='base', paper_size='A4_LANDSCAPE', y1
     - mode (str, optional): Type of plot ('line', 'area', 'bar', 'stackedbar', 'markers'). Default is 'line'.
     - show_days (bool, optional): If True, adds vertical grid lines at daily intervals. Default is False.
 
+    Line, area and marker modes are drawn with WebGL (Scattergl) traces, which render
+    long hourly series much faster in the browser than SVG scatter traces.
+
     Returns:
     - fig (plotly.graph_objects.Figure): The generated Plotly figure.
 
@@ -62,56 +68,54 @@ def plot_series(series_list, template_name='base', paper_size='A4_LANDSCAPE', y1
     # Use the validated series list
     series_list = validated_series
 
-    units = set()
+    # Resolve the trace type for the mode once, failing before any traces are built
+    if mode not in _MODE_TRACES:
+        raise ValueError("Invalid mode. Choose from 'line', 'area', 'bar', 'stackedbar', or 'markers'.")
+    trace_cls, mode_kwargs, has_line = _MODE_TRACES[mode]
+
+    unit_list = []  # Unique units in the order the series declare them
     series_data = []
     colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
 
     for i, series in enumerate(series_list):
         name = getattr(series, 'name', 'Unnamed')
         unit = series.attrs.get("unit", None)
-        units.add(unit)
+        if unit not in unit_list:
+            unit_list.append(unit)
         # Get custom attributes with defaults
         linestyle = series.attrs.get("linestyle", "solid")  # Default to solid line
         color = series.attrs.get("color", colors[i % len(colors)])  # Default to predefined colors
         series_data.append({'series': series, 'name': name, 'unit': unit, 'color': color, 'linestyle': linestyle})
 
-    if len(units) > 2:
+    if len(unit_list) > 2:
         raise ValueError("More than two unique units detected. Only up to two units are supported.")
 
-    y1_label = "{} ({})".format(y1_axis_title, list(units)[0]) if len(units) > 0 else y1_axis_title
-    y2_label = "{} ({})".format(y1_axis_title, list(units)[1]) if len(units) == 2 else None
+    # Resolve the unit -> y-axis assignment once instead of per series; the first unit
+    # goes on the left axis and the second on the right
+    unit_map = {unit: ("y2" if i == 1 else "y1") for i, unit in enumerate(unit_list)}
 
-    fig = go.Figure()
+    y1_label = "{} ({})".format(y1_axis_title, unit_list[0]) if len(unit_list) > 0 else y1_axis_title
+    y2_label = "{} ({})".format(y1_axis_title, unit_list[1]) if len(unit_list) == 2 else None
 
+    traces = []
     for data in series_data:
-        y_axis = "y2" if y2_label and data['unit'] == list(units)[1] else "y1"
+        y_axis = unit_map[data['unit']]
+        index = data['series'].index
         trace_kwargs = {
-            "x": data['series'].index,
-            "y": data['series'].values,
+            # Hand Plotly plain arrays; tz-aware indexes stay as-is so their local times are kept
+            "x": index.to_numpy() if index.tz is None else index,
+            "y": data['series'].to_numpy(),
             "name": data['name'],
             "yaxis": y_axis,
             "marker": {"color": data['color']}
         }
-
-        if mode == "line":
-            trace_kwargs["line"] = {"dash": data['linestyle']}
-            trace = go.Scatter(mode="lines", **trace_kwargs)
-        elif mode == "area":
+        if has_line:
             trace_kwargs["line"] = {"dash": data['linestyle']}
-            trace = go.Scatter(mode="lines", fill="tozeroy", **trace_kwargs)
-        elif mode == "bar":
-            trace = go.Bar(**trace_kwargs)
-        elif mode == "stackedbar":
-            trace = go.Bar(**trace_kwargs)
-        elif mode == "markers":
-            trace = go.Scatter(mode="markers", **trace_kwargs)
-        else:
-            raise ValueError("Invalid mode. Choose from 'line', 'area', 'bar', 'stackedbar', or 'markers'.")
 
-        fig.add_trace(trace)
+        traces.append(trace_cls(**mode_kwargs, **trace_kwargs))
 
     layout = {
-        "xaxis_title": "Time",
+        "xaxis": {"title": {"text": "Time"}},
         "yaxis": {
             "title": y1_label,
             "side": "left",
@@ -122,27 +126,34 @@ def plot_series(series_list, template_name='base', paper_size='A4_LANDSCAPE', y1
 
     if y2_label:
         layout["yaxis2"] = {
-            "title": y2_label,
+            "title": {"text": y2_label, "standoff": 25},  # Add padding between axis labels and title
             "overlaying": "y",
             "side": "right",
-            "showgrid": False,
-            "title_standoff": 25  # Add padding between axis labels and title
+            "showgrid": False
         }
 
     if show_days:
         # Get the time index from the first series
         index_ref = series_list[0].index
-        min_time = index_ref.min()
-        max_time = index_ref.max()
-        day_ticks = pd.date_range(start=min_time, end=max_time, freq='D')
-        layout["xaxis"] = {
+        if index_ref.is_monotonic_increasing:
+            min_time, max_time = index_ref[0], index_ref[-1]  # Sorted, so the ends are the range
+        else:
+            min_time, max_time = index_ref.min(), index_ref.max()
+        if index_ref.tz is None:
+            # Daily steps from the first timestamp as a plain datetime64 array
+            num_days = (max_time - min_time) // pd.Timedelta(days=1)
+            day_ticks = min_time.to_datetime64() + np.arange(num_days + 1) * np.timedelta64(1, 'D')
+        else:
+            day_ticks = pd.date_range(start=min_time, end=max_time, freq='D')
+        layout["xaxis"].update({
             "tickmode": "array",
             "tickvals": day_ticks,
             "tickformat": "%Y-%m-%d",
             "showgrid": True,
             "gridcolor": "lightgray"
-        }
+        })
 
-    fig.update_layout(layout)
+    # Validate the traces and the layout together in one step
+    fig = go.Figure(data=traces, layout=layout)
     fig = util_plotly.apply_template_to_figure(fig, template_name=template_name, paper_size=paper_size)
     return fig
@@ -5,6 +5,27 @@ import numpy as np
 from climatevis.util import util_plotly
 from climatevis.util.validation import validate_plot_parameters
 
+# Wind speed bins (m/s, left-closed) with their labels and colors from cool (blue) to hot (red)
+_SPEED_BINS = (0, 2, 5, 10, 15, 20)
+_SPEED_EDGES = np.array(_SPEED_BINS, dtype=float)
+_SPEED_LABELS = tuple(f'{_SPEED_BINS[i]}-{_SPEED_BINS[i+1]} m/s' for i in range(len(_SPEED_BINS)-1))
+_SPEED_COLORS = ('blue', 'dodgerblue', 'deepskyblue', 'orange', 'red')
+
+# Sector mapping to degrees
+_SECTOR_DEGREES = {
+    'N': 0, 'NNE': 22.5, 'NE': 45, 'ENE': 67.5,
+    'E': 90, 'ESE': 112.5, 'SE': 135, 'SSE': 157.5,
+    'S': 180, 'SSW': 202.5, 'SW': 225, 'WSW': 247.5,
+    'W': 270, 'WNW': 292.5, 'NW': 315, 'NNW': 337.5
+}
+_SECTORS = tuple(_SECTOR_DEGREES.keys())
+_SECTOR_ANGLES = tuple(_SECTOR_DEGREES.values())
+_SECTOR_INDEX = pd.Index(_SECTORS)
+
+# Radial axis ticks every 10%
+_RADIAL_TICKS = tuple(range(0, 110, 10))
+_RADIAL_TICK_TEXT = tuple(f'{i}%' for i in _RADIAL_TICKS)
+
 def wind_rose(windspeed: pd.Series, sector: pd.Series, template_name: str, paper_size: str):
     """
     Create a wind rose plot showing wind speed and direction frequency distribution.
@@ -34,60 +55,44 @@ def wind_rose(windspeed: pd.Series, sector: pd.Series, template_name: str, paper
     if not windspeed.index.equals(sector.index):
         raise ValueError("wind_rose: windspeed and sector must have the same DatetimeIndex")
 
-    # Define wind speed bins
-    bins = [0, 2, 5, 10, 15, 20]
-    labels = [f'{bins[i]}-{bins[i+1]} m/s' for i in range(len(bins)-1)]
-
-    # Assign colors from cool (blue) to hot (red)
-    colors = ['blue', 'dodgerblue', 'deepskyblue', 'orange', 'red']
-
-    # Convert wind speed values into bins
-    speed_bin = pd.cut(windspeed, bins=bins, labels=labels, right=False)
-
-    # Define sector mapping to degrees
-    sector_degrees = {
-        'N': 0, 'NNE': 22.5, 'NE': 45, 'ENE': 67.5,
-        'E': 90, 'ESE': 112.5, 'SE': 135, 'SSE': 157.5,
-        'S': 180, 'SSW': 202.5, 'SW': 225, 'WSW': 247.5,
-        'W': 270, 'WNW': 292.5, 'NW': 315, 'NNW': 337.5
-    }
-    full_sectors = list(sector_degrees.keys())
-    full_sector_angles = list(sector_degrees.values())
-
-    # Create a DataFrame for grouping
-    df = pd.DataFrame({'Sector': sector, 'Speed Bin': speed_bin})
+    # Map each record to a sector row and a left-closed speed bin column; unknown sectors
+    # and speeds outside [0, 20) (including NaN) fall out of range and are not counted
+    sector_idx = _SECTOR_INDEX.get_indexer(sector.to_numpy())
+    speed_idx = np.searchsorted(_SPEED_EDGES, windspeed.to_numpy(dtype=float), side='right') - 1
+    valid = (sector_idx >= 0) & (speed_idx >= 0) & (speed_idx < len(_SPEED_LABELS))
 
-    # Compute sector-speed frequency distribution
-    sector_speed_counts = df.groupby(['Sector', 'Speed Bin'], observed=True).size().unstack(fill_value=0)
-    sector_speed_counts = sector_speed_counts.reindex(columns=labels, fill_value=0)
-    sector_frequencies = sector_speed_counts.div(sector_speed_counts.sum(axis=1), axis=0) * 100  # Convert to percentage
+    # Compute the sector-speed frequency distribution as a sectors x bins count matrix
+    flat_idx = sector_idx[valid] * len(_SPEED_LABELS) + speed_idx[valid]
+    counts = np.bincount(flat_idx, minlength=len(_SECTORS) * len(_SPEED_LABELS)).reshape(len(_SECTORS), len(_SPEED_LABELS))
+    sector_totals = counts.sum(axis=1, keepdims=True)
+    sector_frequencies = np.divide(counts, sector_totals, out=np.zeros(counts.shape), where=sector_totals > 0) * 100  # Convert to percentage
 
-    # Create wind rose plot
-    fig = go.Figure()
-    for label, color in zip(labels, colors):
-        r_values = sector_frequencies[label].reindex(full_sectors).fillna(0).values
-        fig.add_trace(go.Barpolar(
-            r=r_values,
-            theta=full_sector_angles,
+    # Create wind rose plot, one stacked trace per speed bin so each keeps its legend entry
+    traces = [
+        go.Barpolar(
+            r=sector_frequencies[:, j],
+            theta=_SECTOR_ANGLES,
             name=label,
             marker_color=color,
             marker_line_color='white',
             opacity=0.7
-        ))
+        )
+        for j, (label, color) in enumerate(zip(_SPEED_LABELS, _SPEED_COLORS))
+    ]
 
     # Layout customization
-    fig.update_layout(
+    layout = dict(
         polar=dict(
             angularaxis=dict(
                 direction='clockwise',
                 tickmode='array',
-                tickvals=full_sector_angles,
-                ticktext=full_sectors,
+                tickvals=_SECTOR_ANGLES,
+                ticktext=_SECTORS,
                 rotation=90
             ),
             radialaxis=dict(
-                tickvals=np.arange(0, 110, 10),
-                ticktext=[f'{i}%' for i in np.arange(0, 110, 10)],
+                tickvals=_RADIAL_TICKS,
+                ticktext=_RADIAL_TICK_TEXT,
                 range=[0, 100],
                 angle=67,
                 gridcolor='lightgray',
@@ -96,6 +101,7 @@ def wind_rose(windspeed: pd.Series, sector: pd.Series, template_name: str, paper
         ),
         showlegend=True,
     )
+    fig = go.Figure(data=traces, layout=layout)
 
     # Apply template and return figure
     # template='plotly_white'
@@ -1,6 +1,8 @@
+import copy
 import yaml
 import logging
 import plotly.io as pio
+from functools import lru_cache
 
 # Import for package resource loading
 try:
@@ -14,11 +16,8 @@ except ImportError:
         import pkg_resources
         files = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Module logger; handlers and levels are left to the application
+logger = logging.getLogger(__name__)
 
 # Built-in template mapping - single source of truth
 BUILTIN_TEMPLATES = {
@@ -51,6 +50,72 @@ PAPER_SIZES = {
     "A0_PORTRAIT": {"width": 3175, "height": 4494}
 }
 
+# Use libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def _parse_yaml(stream):
+    """
+    Parse YAML from a string or file object with the fastest available safe loader.
+    """
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+# Set once the built-in templates have been registered with Plotly
+_templates_loaded = False
+
+def _ensure_templates_loaded():
+    """
+    Load the built-in templates on first use rather than at package import.
+    """
+    if not _templates_loaded:
+        # Keep any template the user registered under a built-in name before first use
+        load_all_builtin_templates(skip_registered=True)
+
+def _read_via_templates_package(template_filename):
+    # importlib.resources (Python 3.9+) or importlib_resources
+    templates_dir = files('climatevis.templates')
+    if templates_dir is None:
+        raise ValueError("Could not locate climatevis.templates package directory")
+    return (templates_dir / template_filename).read_text(encoding='utf-8')
+
+def _read_via_package_data(template_filename):
+    # importlib.resources with the templates as package data
+    return (files('climatevis') / 'templates' / template_filename).read_text(encoding='utf-8')
+
+def _read_via_pkg_resources_templates(template_filename):
+    return pkg_resources.resource_string('climatevis.templates', template_filename).decode('utf-8')
+
+def _read_via_pkg_resources_package(template_filename):
+    return pkg_resources.resource_string('climatevis', f'templates/{template_filename}').decode('utf-8')
+
+@lru_cache(maxsize=1)
+def _template_reader():
+    """
+    Pick the first way of reading package template files that works in this installation.
+
+    The readers are probed once with a built-in template, so later loads go straight to
+    the working one instead of walking the fallback chain on every call.
+    """
+    readers = [_read_via_pkg_resources_templates, _read_via_pkg_resources_package]
+    if files is not None:
+        readers = [_read_via_templates_package, _read_via_package_data] + readers
+
+    probe_filename = next(iter(BUILTIN_TEMPLATES.values()))
+    for reader in readers:
+        try:
+            reader(probe_filename)
+            return reader
+        except Exception as e:
+            last_error = e
+            logger.error("Template reader %s failed: %s", reader.__name__, e)
+    raise last_error
+
+@lru_cache(maxsize=None)
+def _read_package_template(template_filename):
+    """
+    Read and parse a template file from the climatevis.templates package (cached per filename).
+    """
+    return _parse_yaml(_template_reader()(template_filename))
+
 def load_plotly_template_from_package(template_filename, template_name):
     """
     Load a Plotly template from a package template file and register it with Plotly.
@@ -63,73 +128,20 @@ def load_plotly_template_from_package(template_filename, template_name):
         dict: The loaded template.
     """
     try:
-        # Load template from package data
-        if files is not None:
-            # Use importlib.resources (Python 3.9+) or importlib_resources
-            try:
-                templates_dir = files('climatevis.templates')
-                if templates_dir is None:
-                    raise ValueError("Could not locate climatevis.templates package directory")
-
-                template_path = templates_dir / template_filename
-                if template_path is None:
-                    raise ValueError(f"Could not locate template file: {template_filename}")
-
-                with template_path.open('r', encoding='utf-8') as file:
-                    template = yaml.safe_load(file)
-            except Exception as e:
-                logging.error(f"Failed to load template via importlib.resources: {e}")
-                logging.info("Trying alternative importlib.resources approach")
-                # Try alternative approach - templates as package data
-                try:
-                    climatevis_files = files('climatevis')
-                    template_path = climatevis_files / 'templates' / template_filename
-                    with template_path.open('r', encoding='utf-8') as file:
-                        template = yaml.safe_load(file)
-                except Exception as e2:
-                    logging.error(f"Alternative importlib.resources approach failed: {e2}")
-                    logging.info("Falling back to pkg_resources method")
-                    # Fallback to pkg_resources
-                    try:
-                        template_content = pkg_resources.resource_string(
-                            'climatevis.templates', template_filename
-                        ).decode('utf-8')
-                        template = yaml.safe_load(template_content)
-                    except Exception as e3:
-                        logging.error(f"pkg_resources with climatevis.templates failed: {e3}")
-                        logging.info("Trying pkg_resources with climatevis package")
-                        # Final fallback - try as package data
-                        template_content = pkg_resources.resource_string(
-                            'climatevis', f'templates/{template_filename}'
-                        ).decode('utf-8')
-                        template = yaml.safe_load(template_content)
-        else:
-            # Fallback to pkg_resources
-            try:
-                template_content = pkg_resources.resource_string(
-                    'climatevis.templates', template_filename
-                ).decode('utf-8')
-                template = yaml.safe_load(template_content)
-            except Exception as e:
-                logging.error(f"pkg_resources with climatevis.templates failed: {e}")
-                logging.info("Trying pkg_resources with climatevis package")
-                # Final fallback - try as package data
-                template_content = pkg_resources.resource_string(
-                    'climatevis', f'templates/{template_filename}'
-                ).decode('utf-8')
-                template = yaml.safe_load(template_content)
+        # Parsed once per file; hand out a copy so callers cannot alter the cached template
+        template = copy.deepcopy(_read_package_template(template_filename))
 
         # Register the template with Plotly
         pio.templates[template_name] = template
-        logging.info(f"Template '{template_name}' successfully loaded from package and registered.")
+        logger.info("Template '%s' successfully loaded from package and registered.", template_name)
 
         return template
 
     except Exception as e:
-        logging.error(f"Failed to load template from package: {e}")
-        logging.error(f"Template filename: {template_filename}")
-        logging.error(f"Template name: {template_name}")
-        logging.error(f"Files module available: {files is not None}")
+        logger.error("Failed to load template from package: %s", e)
+        logger.error("Template filename: %s", template_filename)
+        logger.error("Template name: %s", template_name)
+        logger.error("Files module available: %s", files is not None)
         raise
 
 def load_plotly_template(yaml_file_path, template_name):
@@ -155,11 +167,11 @@ def load_plotly_template(yaml_file_path, template_name):
     try:
         # Load the YAML file
         with open(yaml_file_path, "r") as file:
-            template = yaml.safe_load(file)
+            template = _parse_yaml(file)
 
         # Register the template with Plotly
         pio.templates[template_name] = template
-        logging.info(f"Template '{template_name}' successfully loaded and registered.")
+        logger.info("Template '%s' successfully loaded and registered.", template_name)
 
         # Log a summary of the template
         # summarize_template(template, template_name)
@@ -167,7 +179,7 @@ def load_plotly_template(yaml_file_path, template_name):
         return template
 
     except Exception as e:
-        logging.error(f"Failed to load template: {e}")
+        logger.error("Failed to load template: %s", e)
         raise
 
 def load_builtin_template(template_name, register_as=None):
@@ -204,26 +216,36 @@ def get_loaded_template_names():
     Returns:
         list: List of loaded template names.
     """
+    _ensure_templates_loaded()
     return list(pio.templates.keys())
 
-def load_all_builtin_templates():
+def load_all_builtin_templates(skip_registered=False):
     """
     Load all built-in templates and register them with their default names.
-    This function is called automatically when the package is imported.
+    This function is called automatically the first time a template is needed.
+
+    Parameters:
+        skip_registered (bool): If True, leave names already present in
+                                plotly.io.templates untouched.
 
     Returns:
         dict: Dictionary mapping template names to loaded template data.
     """
+    global _templates_loaded
+    _templates_loaded = True
+
     loaded_templates = {}
     builtin_names = get_builtin_template_names()
 
     for template_name in builtin_names:
+        if skip_registered and template_name in pio.templates:
+            continue
         try:
             template_data = load_builtin_template(template_name)
             loaded_templates[template_name] = template_data
-            logging.info(f"Auto-loaded template '{template_name}'")
+            logger.info("Auto-loaded template '%s'", template_name)
         except Exception as e:
-            logging.error(f"Failed to auto-load template '{template_name}': {e}")
+            logger.error("Failed to auto-load template '%s': %s", template_name, e)
 
     return loaded_templates
 
@@ -235,6 +257,8 @@ def get_available_templates():
     Returns:
         list: Sorted list of available template names.
     """
+    _ensure_templates_loaded()
+
     # Get built-in templates
     builtin = get_builtin_template_names()
 
@@ -254,25 +278,40 @@ def summarize_template(template, template_name):
         template (dict): The loaded Plotly template.
         template_name (str): Name of the template.
     """
-    logging.info(f"Summary of template '{template_name}':")
+    logger.info("Summary of template '%s':", template_name)
 
     # Summarize layout properties
     if "layout" in template:
         layout_keys = list(template["layout"].keys())
-        logging.info(f"  Layout keys: {layout_keys}")
+        logger.info("  Layout keys: %s", layout_keys)
 
         # Example: Log specific layout properties
         if "font" in template["layout"]:
-            logging.info(f"  Font settings: {template['layout']['font']}")
+            logger.info("  Font settings: %s", template['layout']['font'])
         if "xaxis" in template["layout"]:
-            logging.info(f"  X-axis settings: {template['layout']['xaxis']}")
+            logger.info("  X-axis settings: %s", template['layout']['xaxis'])
         if "yaxis" in template["layout"]:
-            logging.info(f"  Y-axis settings: {template['layout']['yaxis']}")
+            logger.info("  Y-axis settings: %s", template['layout']['yaxis'])
 
     # # Summarize data properties
     # if "data" in template:
     #     data_keys = list(template["data"].keys())
-    #     logging.info(f"  Data keys (trace types): {data_keys}")
+    #     logger.info("  Data keys (trace types): %s", data_keys)
+
+# Autosize flag per template name, stored with the template object it was read from
+_template_autosize_cache = {}
+
+def _template_autosize(template_name):
+    """
+    Return the template's layout.autosize setting, reading it once per registered template object.
+    """
+    template = pio.templates[template_name]
+    cached = _template_autosize_cache.get(template_name)
+    if cached is None or cached[0] is not template:
+        # Re-read when the name was (re-)registered with a different template
+        cached = (template, template['layout']['autosize'])
+        _template_autosize_cache[template_name] = cached
+    return cached[1]
 
 def apply_template_to_figure(fig, template_name, paper_size=None):
     """
@@ -288,26 +327,26 @@ def apply_template_to_figure(fig, template_name, paper_size=None):
     Returns:
         plotly.graph_objects.Figure: The updated figure with the template and paper size applied.
     """
+    _ensure_templates_loaded()
+
     if template_name not in pio.templates:
-        logging.error(f"Template '{template_name}' is not registered.")
+        logger.error("Template '%s' is not registered.", template_name)
         raise ValueError(f"Template '{template_name}' is not registered. Please load it first.")
 
-    # Apply the template
-    fig.update_layout(template=template_name)
-    logging.info(f"Template '{template_name}' applied to figure.")
+    # Collect the template and paper size into a single layout update
+    layout_updates = {"template": template_name}
+    logger.debug("Template '%s' applied to figure.", template_name)
 
     # Check if the template has autosize enabled
-    template = pio.templates[template_name]
-    # is_autosize_enabled = template.get("layout", {}).get("autosize", False)
-
-    if template['layout']['autosize']:
-        logging.info(f"Template '{template_name}' has autosize enabled. Ignoring paper size setting.")
+    if _template_autosize(template_name):
+        logger.debug("Template '%s' has autosize enabled. Ignoring paper size setting.", template_name)
     elif paper_size:
         if paper_size not in PAPER_SIZES:
-            logging.error(f"Invalid paper size '{paper_size}'. Available sizes: {list(PAPER_SIZES.keys())}")
+            logger.error("Invalid paper size '%s'. Available sizes: %s", paper_size, list(PAPER_SIZES.keys()))
             raise ValueError(f"Invalid paper size '{paper_size}'.")
         paper_dimensions = PAPER_SIZES[paper_size]
-        fig.update_layout(**paper_dimensions)
-        logging.info(f"Paper size '{paper_size}' applied: width={paper_dimensions['width']}, height={paper_dimensions['height']}.")
+        layout_updates.update(paper_dimensions)
+        logger.debug("Paper size '%s' applied: width=%s, height=%s.", paper_size, paper_dimensions['width'], paper_dimensions['height'])
 
+    fig.update_layout(**layout_updates)
     return fig
\ No newline at end of file
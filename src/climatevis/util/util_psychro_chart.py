@@ -1,3 +1,4 @@
+from functools import lru_cache
 import numpy as np
 import plotly.graph_objs as go
 import psychrolib
@@ -6,8 +7,8 @@ import logging
 # Initialize psychrolib for SI units
 psychrolib.SetUnitSystem(psychrolib.SI)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# Module logger; handlers and levels are left to the application
+logger = logging.getLogger(__name__)
 
 # Constants for colors and styles
 COLOR_LIGHT_GREY = '#e0e0e0'      # Light grey for minor grid lines
@@ -20,6 +21,191 @@ LINE_WIDTH_MAJOR = 1.5            # Line width for major grid lines
 LINE_WIDTH_RH = 1                 # Line width for RH lines
 LINE_STYLE_RH = 'solid'            # Line style for RH lines
 
+# psychrolib constants (SI) used by the vectorized helpers below
+_TRIPLE_POINT_WATER = 0.01        # °C
+_SAT_TEMP_BOUNDS = (-100.0, 200.0)  # °C, validity range of the saturation pressure equations
+_MOLAR_MASS_RATIO = 0.621945      # Ratio of molar masses of water vapor and dry air
+
+def _sat_vap_pres(t):
+    """
+    Vectorized saturation vapor pressure, same equations as psychrolib.GetSatVapPres (SI).
+
+    Parameters:
+    - t (array-like): Dry-bulb temperature(s) in °C.
+
+    Returns:
+    - numpy.ndarray: Saturation vapor pressure in Pa, NaN outside the validity range.
+    """
+    t = np.asarray(t, dtype=float)
+    T = t + 273.15
+    ln_pws = np.where(
+        t <= _TRIPLE_POINT_WATER,
+        -5.6745359E+03 / T + 6.3925247 - 9.677843E-03 * T + 6.2215701E-07 * T**2
+        + 2.0747825E-09 * T**3 - 9.484024E-13 * T**4 + 4.1635019 * np.log(T),
+        -5.8002206E+03 / T + 1.3914993 - 4.8640239E-02 * T + 4.1764768E-05 * T**2
+        - 1.4452093E-08 * T**3 + 6.5459673 * np.log(T),
+    )
+    valid = (t >= _SAT_TEMP_BOUNDS[0]) & (t <= _SAT_TEMP_BOUNDS[1])
+    return np.where(valid, np.exp(ln_pws), np.nan)
+
+def _sat_hum_ratio(t, pressure):
+    """
+    Vectorized saturation humidity ratio, equivalent to psychrolib.GetHumRatioFromRelHum(t, 1.0, pressure).
+
+    Parameters:
+    - t (array-like): Dry-bulb temperature(s) in °C.
+    - pressure (float): Atmospheric pressure in Pascals.
+
+    Returns:
+    - numpy.ndarray: Saturation humidity ratio in kg/kg, NaN outside the validity range.
+    """
+    return _hum_ratio_from_vap_pres(_sat_vap_pres(t), pressure)
+
+def _dln_sat_vap_pres(t):
+    """
+    Vectorized derivative of ln(saturation vapor pressure), same as psychrolib.dLnPws_ (SI).
+    """
+    t = np.asarray(t, dtype=float)
+    T = t + 273.15
+    return np.where(
+        t <= _TRIPLE_POINT_WATER,
+        5.6745359E+03 / T**2 - 9.677843E-03 + 2 * 6.2215701E-07 * T
+        + 3 * 2.0747825E-09 * T**2 - 4 * 9.484024E-13 * T**3 + 4.1635019 / T,
+        5.8002206E+03 / T**2 - 4.8640239E-02 + 2 * 4.1764768E-05 * T
+        - 3 * 1.4452093E-08 * T**2 + 6.5459673 / T,
+    )
+
+def _hum_ratio_from_vap_pres(vap_pres, pressure):
+    """
+    Vectorized humidity ratio from vapor pressure, same as psychrolib.GetHumRatioFromVapPres (SI).
+    """
+    return np.maximum(_MOLAR_MASS_RATIO * vap_pres / (pressure - vap_pres), psychrolib.MIN_HUM_RATIO)
+
+def _vap_pres_from_hum_ratio(w, pressure):
+    """
+    Vectorized vapor pressure from humidity ratio, same as psychrolib.GetVapPresFromHumRatio (SI).
+    Negative humidity ratios give NaN.
+    """
+    w = np.asarray(w, dtype=float)
+    bounded_w = np.maximum(w, psychrolib.MIN_HUM_RATIO)
+    return np.where(w >= 0, pressure * bounded_w / (_MOLAR_MASS_RATIO + bounded_w), np.nan)
+
+def _moist_air_enthalpy(t, w):
+    """
+    Vectorized moist air enthalpy in J/kg, same as psychrolib.GetMoistAirEnthalpy (SI).
+    Negative humidity ratios give NaN.
+    """
+    w = np.asarray(w, dtype=float)
+    bounded_w = np.maximum(w, psychrolib.MIN_HUM_RATIO)
+    return np.where(w >= 0, (1.006 * t + bounded_w * (2501. + 1.86 * t)) * 1000, np.nan)
+
+def _dry_bulb_from_enthalpy(enthalpy, w):
+    """
+    Vectorized dry-bulb temperature in °C, same as psychrolib.GetTDryBulbFromEnthalpyAndHumRatio (SI).
+    Negative humidity ratios give NaN.
+    """
+    w = np.asarray(w, dtype=float)
+    bounded_w = np.maximum(w, psychrolib.MIN_HUM_RATIO)
+    return np.where(w >= 0, (enthalpy / 1000.0 - 2501.0 * bounded_w) / (1.006 + 1.86 * bounded_w), np.nan)
+
+def _dew_point_from_vap_pres(t, vap_pres):
+    """
+    Vectorized dew-point temperature, same Newton-Raphson iteration as
+    psychrolib.GetTDewPointFromVapPres (SI), run element-wise until each value converges.
+
+    Parameters:
+    - t (array-like): Dry-bulb temperature(s) in °C, used as first guess and upper bound.
+    - vap_pres (array-like): Partial pressure of water vapor in Pa.
+
+    Returns:
+    - numpy.ndarray: Dew-point temperature in °C, NaN where no solution exists.
+    """
+    t, vap_pres = np.broadcast_arrays(np.asarray(t, dtype=float), np.asarray(vap_pres, dtype=float))
+    lower, upper = _SAT_TEMP_BOUNDS
+    valid = (vap_pres >= _sat_vap_pres(lower)) & (vap_pres <= _sat_vap_pres(upper))
+    t_dew = t.astype(float).ravel()
+    ln_vp = np.log(np.where(valid, vap_pres, np.nan)).ravel()
+    active = valid.ravel().copy()
+    for _ in range(psychrolib.MAX_ITER_COUNT + 1):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        t_iter = t_dew[idx]
+        t_new = t_iter - (np.log(_sat_vap_pres(t_iter)) - ln_vp[idx]) / _dln_sat_vap_pres(t_iter)
+        t_new = np.clip(t_new, lower, upper)
+        t_dew[idx] = t_new
+        active[idx] = np.abs(t_new - t_iter) > psychrolib.PSYCHROLIB_TOLERANCE
+    t_dew = np.minimum(t_dew.reshape(t.shape), t)
+    return np.where(valid, t_dew, np.nan)
+
+def _hum_ratio_from_wet_bulb(t, t_wet_bulb, pressure):
+    """
+    Vectorized humidity ratio from wet-bulb temperature, same as psychrolib.GetHumRatioFromTWetBulb (SI).
+    """
+    ws_star = _sat_hum_ratio(t_wet_bulb, pressure)
+    w = np.where(
+        t_wet_bulb >= 0.0,
+        ((2501. - 2.326 * t_wet_bulb) * ws_star - 1.006 * (t - t_wet_bulb))
+        / (2501. + 1.86 * t - 4.186 * t_wet_bulb),
+        ((2830. - 0.24 * t_wet_bulb) * ws_star - 1.006 * (t - t_wet_bulb))
+        / (2830. + 1.86 * t - 2.1 * t_wet_bulb),
+    )
+    return np.maximum(w, psychrolib.MIN_HUM_RATIO)
+
+def _wet_bulb_from_hum_ratio(t, w, pressure, vap_pres=None):
+    """
+    Vectorized wet-bulb temperature, same bisection as psychrolib.GetTWetBulbFromHumRatio (SI),
+    run element-wise between the dew point and the dry-bulb temperature.
+
+    Parameters:
+    - t (array-like): Dry-bulb temperature(s) in °C.
+    - w (array-like): Humidity ratio(s) in kg/kg.
+    - pressure (float): Atmospheric pressure in Pascals.
+    - vap_pres (numpy.ndarray, optional): Vapor pressure for w, computed when not given.
+
+    Returns:
+    - numpy.ndarray: Wet-bulb temperature in °C, NaN where it cannot be computed.
+    """
+    t, w = np.broadcast_arrays(np.asarray(t, dtype=float), np.asarray(w, dtype=float))
+    if vap_pres is None:
+        vap_pres = _vap_pres_from_hum_ratio(w, pressure)
+    bounded_w = np.maximum(w, psychrolib.MIN_HUM_RATIO).ravel()
+    t_flat = t.ravel()
+    t_sup = t_flat.copy()
+    t_inf = _dew_point_from_vap_pres(t, vap_pres).ravel()
+    t_wet_bulb = (t_inf + t_sup) / 2
+    active = (t_sup - t_inf) > psychrolib.PSYCHROLIB_TOLERANCE
+    for _ in range(psychrolib.MAX_ITER_COUNT):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        too_wet = _hum_ratio_from_wet_bulb(t_flat[idx], t_wet_bulb[idx], pressure) > bounded_w[idx]
+        t_sup[idx[too_wet]] = t_wet_bulb[idx[too_wet]]
+        t_inf[idx[~too_wet]] = t_wet_bulb[idx[~too_wet]]
+        t_wet_bulb[idx] = (t_sup[idx] + t_inf[idx]) / 2
+        active[idx] = (t_sup[idx] - t_inf[idx]) > psychrolib.PSYCHROLIB_TOLERANCE
+    return t_wet_bulb.reshape(t.shape)
+
+def _psychro_properties(t, w, pressure):
+    """
+    Evaluates the hover properties for a grid of points in one pass, computing the
+    vapor pressure once and sharing it between relative humidity and wet-bulb temperature.
+
+    Parameters:
+    - t (array-like): Dry-bulb temperature(s) in °C.
+    - w (array-like): Humidity ratio(s) in kg/kg.
+    - pressure (float): Atmospheric pressure in Pascals.
+
+    Returns:
+    - tuple of numpy.ndarray: Relative humidity (%), wet-bulb temperature (°C) and enthalpy (kJ/kg).
+    """
+    t, w = np.broadcast_arrays(np.asarray(t, dtype=float), np.asarray(w, dtype=float))
+    vap_pres = _vap_pres_from_hum_ratio(w, pressure)
+    rh = vap_pres / _sat_vap_pres(t) * 100  # %
+    twb = _wet_bulb_from_hum_ratio(t, w, pressure, vap_pres)
+    h = _moist_air_enthalpy(t, w) / 1000  # kJ/kg
+    return rh, twb, h
+
 def generate_hover_text(**kwargs):
     """
     Generates HTML-formatted hover text based on provided keyword arguments.
@@ -33,7 +219,93 @@ def generate_hover_text(**kwargs):
     hover_text = "<br>".join([f"{key}: {value}" for key, value in kwargs.items()])
     return hover_text
 
-def plot_humidity_ratio_lines(fig, temp_range, humidity_ratios, pressure):
+# Hover templates for the chart lines; Plotly formats x, y and customdata on hover
+_HOVER_GRID = (
+    "Temperature: %{x:.1f}°C<br>Humidity_Ratio: %{y:.3f} kg/kg<br>Relative_Humidity: %{customdata[0]:.1f}%<br>"
+    "Wet_Bulb_Temp: %{customdata[1]:.1f}°C<br>Enthalpy: %{customdata[2]:.1f} kJ/kg<extra></extra>"
+)
+_HOVER_RH = (
+    "Relative_Humidity: %{customdata[0]}%<br>Temperature: %{x:.1f}°C<br>Humidity_Ratio: %{y:.3f} kg/kg<br>"
+    "Wet_Bulb_Temp: %{customdata[1]:.1f}°C<br>Enthalpy: %{customdata[2]:.1f} kJ/kg<extra></extra>"
+)
+_HOVER_SATURATION = (
+    "Saturation_Curve: RH=100%<br>Temperature: %{x:.1f}°C<br>Humidity_Ratio: %{y:.3f} kg/kg<br>"
+    "Relative_Humidity: 100.0%<br>Wet_Bulb_Temp: %{customdata[1]:.1f}°C<br>Enthalpy: %{customdata[2]:.1f} kJ/kg"
+    "<extra></extra>"
+)
+_HOVER_ENTHALPY = (
+    "Enthalpy: %{customdata[2]} kJ/kg<br>Temperature: %{x:.1f}°C<br>Humidity_Ratio: %{y:.3f} kg/kg<br>"
+    "Relative_Humidity: %{customdata[0]:.1f}%<br>Wet_Bulb_Temp: %{customdata[1]:.1f}°C<extra></extra>"
+)
+_HOVER_INVALID = "Invalid Data<extra></extra>"
+
+def _hover_template(template, x, customdata):
+    """
+    Returns the hover template for a line trace, switching to a per-point array only
+    when some points could not be evaluated (wet-bulb temperature in customdata[:, 1] is NaN).
+
+    Parameters:
+    - template (str): Hover template for valid points.
+    - x (numpy.ndarray): x values of the trace; NaN marks gaps between lines.
+    - customdata (numpy.ndarray): Per-point hover data of the trace.
+
+    Returns:
+    - str or numpy.ndarray: The hover template(s) for the trace.
+    """
+    invalid = np.isnan(customdata[:, 1]) & ~np.isnan(x)
+    if not invalid.any():
+        return template
+    return np.where(invalid, _HOVER_INVALID, template)
+
+def _join_line_segments(segments):
+    """
+    Concatenates line segments into single arrays, separated by NaN gaps so that
+    Plotly draws all of them as one trace.
+
+    Parameters:
+    - segments (list of tuple): (x, y, customdata) arrays for each line.
+
+    Returns:
+    - tuple: Concatenated x, y and customdata arrays.
+    """
+    gap = tuple(np.full((1,) + np.shape(part)[1:], np.nan) for part in segments[0])
+    parts = [part for segment in segments for part in (segment, gap)][:-1]
+    return tuple(np.concatenate(column) for column in zip(*parts))
+
+def _humidity_ratio_traces(temp_range, humidity_ratios, pressure, w_sat_table=None):
+    """
+    Builds the traces drawn by plot_humidity_ratio_lines.
+    """
+    if w_sat_table is None:
+        w_sat_table = _sat_hum_ratio(temp_range, pressure)
+    # The saturation curve rises with T, so each line starts at its crossing with it
+    start = np.searchsorted(w_sat_table, humidity_ratios)
+
+    # Evaluate all properties on the (w, T) grid at once; row i belongs to humidity_ratios[i]
+    T2d, W2d = np.meshgrid(temp_range, humidity_ratios)
+    rh, twb, h = _psychro_properties(T2d, W2d, pressure)
+    customdata = np.stack([rh, twb, h], axis=-1)
+
+    # All lines share one style, so they go into a single NaN-separated trace
+    segments = [
+        (temp_range[start[i]:], W2d[i, start[i]:], customdata[i, start[i]:])
+        for i in range(len(humidity_ratios)) if start[i] < len(temp_range)
+    ]
+    if not segments:
+        return []
+    x, y, line_data = _join_line_segments(segments)
+    return [go.Scatter(
+        x=x,
+        y=y,
+        mode='lines',
+        line=dict(color=COLOR_LIGHT_GREY, width=LINE_WIDTH_MINOR),
+        connectgaps=False,
+        showlegend=False,
+        customdata=line_data,
+        hovertemplate=_hover_template(_HOVER_GRID, x, line_data)
+    )]
+
+def plot_humidity_ratio_lines(fig, temp_range, humidity_ratios, pressure, w_sat_table=None):
     """
     Plots humidity ratio lines (constant w) on the psychrometric chart.
 
@@ -42,58 +314,54 @@ def plot_humidity_ratio_lines(fig, temp_range, humidity_ratios, pressure):
     - temp_range (numpy.ndarray): Array of temperature values.
     - humidity_ratios (numpy.ndarray): Array of humidity ratio values.
     - pressure (float): Atmospheric pressure in Pascals.
+    - w_sat_table (numpy.ndarray, optional): Saturation humidity ratio for each value of temp_range;
+      computed when not given.
 
     Returns:
     - None
     """
-    for w in humidity_ratios:
-        # Determine valid temperature range for the given humidity ratio
-        temp_min_valid = None
-        for t_val in temp_range:
-            try:
-                w_sat = psychrolib.GetHumRatioFromRelHum(t_val, 1.0, pressure)
-                if w <= w_sat:
-                    temp_min_valid = t_val
-                    break
-            except Exception as e:
-                logging.error(f"Error computing saturation humidity ratio for T={t_val}°C: {e}")
-                continue
-
-        if temp_min_valid is not None:
-            temp_valid = temp_range[temp_range >= temp_min_valid]
-            w_values = [w] * len(temp_valid)
-
-            # Compute hover information
-            hover_text = []
-            for t_val in temp_valid:
-                try:
-                    rh = psychrolib.GetRelHumFromHumRatio(t_val, w, pressure) * 100  # %
-                    twb = psychrolib.GetTWetBulbFromHumRatio(t_val, w, pressure)
-                    h = psychrolib.GetMoistAirEnthalpy(t_val, w) / 1000  # kJ/kg
-                    text = generate_hover_text(
-                        Temperature=f"{t_val:.1f}°C",
-                        Humidity_Ratio=f"{w:.3f} kg/kg",
-                        Relative_Humidity=f"{rh:.1f}%",
-                        Wet_Bulb_Temp=f"{twb:.1f}°C",
-                        Enthalpy=f"{h:.1f} kJ/kg"
-                    )
-                except Exception as e:
-                    logging.error(f"Error computing hover text for T={t_val}°C, w={w} kg/kg: {e}")
-                    text = "Invalid Data"
-                hover_text.append(text)
-
-            # Add trace
-            fig.add_trace(go.Scatter(
-                x=temp_valid,
-                y=w_values,
-                mode='lines',
-                line=dict(color=COLOR_LIGHT_GREY, width=LINE_WIDTH_MINOR),
-                showlegend=False,
-                hoverinfo='text',
-                hovertext=hover_text
-            ))
+    fig.add_traces(_humidity_ratio_traces(temp_range, humidity_ratios, pressure, w_sat_table))
 
-def plot_temperature_lines(fig, temp_range, temp_step, line_color_light, line_color_dark, line_width_minor, line_width_major, pressure):
+def _temperature_traces(temp_range, temp_step, line_color_light, line_color_dark, line_width_minor, line_width_major, pressure,
+                        w_sat_table=None):
+    """
+    Builds the traces drawn by plot_temperature_lines.
+    """
+    w_sat = _sat_hum_ratio(temp_range, pressure) if w_sat_table is None else w_sat_table
+    if np.isnan(w_sat).any():
+        logger.error("Error plotting temperature lines for T=%s°C: saturation humidity ratio undefined",
+                     temp_range[np.isnan(w_sat)])
+
+    # Evaluate all properties on the (T, w) grid at once; row j belongs to temp_range[j]
+    W2d = np.linspace(0, w_sat, 50, axis=1)
+    T2d = np.broadcast_to(temp_range[:, None], W2d.shape)
+    rh, twb, h = _psychro_properties(T2d, W2d, pressure)
+    customdata = np.stack([rh, twb, h], axis=-1)
+
+    # One NaN-separated trace per line style: minor lines first, major lines (every 5°C) on top
+    defined = ~np.isnan(w_sat)
+    is_major = temp_range % 5 == 0
+    traces = []
+    for major, line_color, line_width in ((False, line_color_light, line_width_minor),
+                                          (True, line_color_dark, line_width_major)):
+        rows = np.flatnonzero(defined & (is_major == major))
+        if rows.size == 0:
+            continue
+        x, y, line_data = _join_line_segments([(T2d[j], W2d[j], customdata[j]) for j in rows])
+        traces.append(go.Scatter(
+            x=x,
+            y=y,
+            mode='lines',
+            line=dict(color=line_color, width=line_width),
+            connectgaps=False,
+            showlegend=False,
+            customdata=line_data,
+            hovertemplate=_hover_template(_HOVER_GRID, x, line_data)
+        ))
+    return traces
+
+def plot_temperature_lines(fig, temp_range, temp_step, line_color_light, line_color_dark, line_width_minor, line_width_major, pressure,
+                           w_sat_table=None):
     """
     Plots temperature lines (constant T) on the psychrometric chart.
 
@@ -106,57 +374,47 @@ def plot_temperature_lines(fig, temp_range, temp_step, line_color_light, line_co
     - line_width_minor (int): Line width for minor temperature lines.
     - line_width_major (float): Line width for major temperature lines.
     - pressure (float): Atmospheric pressure in Pascals.
+    - w_sat_table (numpy.ndarray, optional): Saturation humidity ratio for each value of temp_range;
+      computed when not given.
 
     Returns:
     - None
     """
-    for t in temp_range:
-        try:
-            w_sat = psychrolib.GetHumRatioFromRelHum(t, 1.0, pressure)
-            w_range = np.linspace(0, w_sat, 50)
-            T_range = [t] * len(w_range)
-
-            hover_text = []
-            for w_val in w_range:
-                try:
-                    rh = psychrolib.GetRelHumFromHumRatio(t, w_val, pressure) * 100  # %
-                    twb = psychrolib.GetTWetBulbFromHumRatio(t, w_val, pressure)
-                    h = psychrolib.GetMoistAirEnthalpy(t, w_val) / 1000  # kJ/kg
-                    text = generate_hover_text(
-                        Temperature=f"{t:.1f}°C",
-                        Humidity_Ratio=f"{w_val:.3f} kg/kg",
-                        Relative_Humidity=f"{rh:.1f}%",
-                        Wet_Bulb_Temp=f"{twb:.1f}°C",
-                        Enthalpy=f"{h:.1f} kJ/kg"
-                    )
-                except Exception as e:
-                    logging.error(f"Error computing hover text for T={t}°C, w={w_val} kg/kg: {e}")
-                    text = "Invalid Data"
-                hover_text.append(text)
-
-            # Determine line color and width
-            if t % 5 == 0:
-                current_line_color = line_color_dark
-                current_line_width = line_width_major
-            else:
-                current_line_color = line_color_light
-                current_line_width = line_width_minor
+    fig.add_traces(_temperature_traces(temp_range, temp_step, line_color_light, line_color_dark,
+                                       line_width_minor, line_width_major, pressure, w_sat_table))
 
-            # Add trace
-            fig.add_trace(go.Scatter(
-                x=T_range,
-                y=w_range,
-                mode='lines',
-                line=dict(color=current_line_color, width=current_line_width),
-                showlegend=False,
-                hoverinfo='text',
-                hovertext=hover_text
-            ))
-        except Exception as e:
-            logging.error(f"Error plotting temperature line for T={t}°C: {e}")
-            continue
+def _enthalpy_traces(temp_range, enthalpy_values, temp_min, temp_max, pressure, w_sat_table=None):
+    """
+    Builds the traces drawn by plot_enthalpy_lines.
+    """
+    if w_sat_table is None:
+        w_sat_table = _sat_hum_ratio(temp_range, pressure)
+
+    # Evaluate the dry-bulb temperature on the (h, w) grid at once; row i belongs to enthalpy_values[i]
+    w_enthalpy = np.linspace(0.005, 0.030, 100)
+    H2d, W2d = np.meshgrid(enthalpy_values, w_enthalpy, indexing='ij')
+    T2d = _dry_bulb_from_enthalpy(H2d * 1000, W2d)
+    # Off-grid temperatures: interpolate the saturation table
+    valid = (T2d >= temp_min) & (T2d <= temp_max) & (W2d <= np.interp(T2d, temp_range, w_sat_table))
+    rh, twb, _ = _psychro_properties(T2d, W2d, pressure)
+    customdata = np.stack([rh, twb, H2d], axis=-1)
+
+    segments = [(T2d[i, row], W2d[i, row], customdata[i, row]) for i, row in enumerate(valid) if row.any()]
+    if not segments:
+        return []
+    x, y, line_data = _join_line_segments(segments)
+    return [go.Scatter(
+        x=x,
+        y=y,
+        mode='lines',
+        line=dict(color=COLOR_LIGHT_GREY, width=1),
+        connectgaps=False,
+        showlegend=False,
+        customdata=line_data,
+        hovertemplate=_hover_template(_HOVER_ENTHALPY, x, line_data)
+    )]
 
-def plot_enthalpy_lines(fig, temp_range, enthalpy_values, temp_min, temp_max, pressure):
+def plot_enthalpy_lines(fig, temp_range, enthalpy_values, temp_min, temp_max, pressure, w_sat_table=None):
     """
     Plots enthalpy lines (constant h) on the psychrometric chart.
 
@@ -167,53 +425,31 @@ def plot_enthalpy_lines(fig, temp_range, enthalpy_values, temp_min, temp_max, pr
     - temp_min (float): Minimum temperature for the chart.
     - temp_max (float): Maximum temperature for the chart.
     - pressure (float): Atmospheric pressure in Pascals.
+    - w_sat_table (numpy.ndarray, optional): Saturation humidity ratio for each value of temp_range;
+      computed when not given.
 
     Returns:
     - None
     """
-    for h in enthalpy_values:
-        temp_vals = []
-        w_vals = []
-        hover_text = []
-
-        # Iterate over a range of humidity ratios
-        w_enthalpy = np.linspace(0.005, 0.030, 100)
-        for w in w_enthalpy:
-            try:
-                # Compute dry-bulb temperature for given enthalpy and humidity ratio
-                t = psychrolib
-
-                t = psychrolib.GetDryBulbFromEnthalpyAndHumRatio(h * 1000, w, pressure)
-                if temp_min <= t <= temp_max:
-                    w_sat = psychrolib.GetHumRatioFromRelHum(t, 1.0, pressure)
-                    if w <= w_sat:
-                        temp_vals.append(t)
-                        w_vals.append(w)
-                        # Compute hover text
-                        rh = psychrolib.GetRelHumFromHumRatio(t, w, pressure) * 100  # %
-                        twb = psychrolib.GetTWetBulbFromHumRatio(t, w, pressure)
-                        text = generate_hover_text(
-                            Enthalpy=f"{h} kJ/kg",
-                            Temperature=f"{t:.1f}°C",
-                            Humidity_Ratio=f"{w:.3f} kg/kg",
-                            Relative_Humidity=f"{rh:.1f}%",
-                            Wet_Bulb_Temp=f"{twb:.1f}°C"
-                        )
-                        hover_text.append(text)
-            except Exception as e:
-                logging.error(f"Error computing enthalpy line for h={h} kJ/kg, w={w} kg/kg: {e}")
-                continue
-
-        if temp_vals and w_vals:
-            fig.add_trace(go.Scatter(
-                x=temp_vals,
-                y=w_vals,
-                mode='lines',
-                line=dict(color=COLOR_LIGHT_GREY, width=1),
-                showlegend=False,
-                hoverinfo='text',
-                hovertext=hover_text
-            ))
+    fig.add_traces(_enthalpy_traces(temp_range, enthalpy_values, temp_min, temp_max, pressure, w_sat_table))
+
+def _saturation_traces(temp_range, saturation_w, pressure):
+    """
+    Builds the traces drawn by plot_saturation_curve.
+    """
+    saturation_w = np.asarray(saturation_w, dtype=float)
+    customdata = np.stack(_psychro_properties(temp_range, saturation_w, pressure), axis=-1)
+
+    return [go.Scatter(
+        x=temp_range,
+        y=saturation_w,
+        mode='lines',
+        line=dict(color=COLOR_SATURATION, width=2),
+        name='Saturation (RH=100%)',
+        showlegend=False,
+        customdata=customdata,
+        hovertemplate=_hover_template(_HOVER_SATURATION, temp_range, customdata)
+    )]
 
 def plot_saturation_curve(fig, temp_range, saturation_w, pressure):
     """
@@ -222,43 +458,55 @@ def plot_saturation_curve(fig, temp_range, saturation_w, pressure):
     Parameters:
     - fig (go.Figure): The Plotly figure object.
     - temp_range (numpy.ndarray): Array of temperature values.
-    - saturation_w (list): List of saturation humidity ratio values.
+    - saturation_w (numpy.ndarray): Saturation humidity ratio values.
     - pressure (float): Atmospheric pressure in Pascals.
 
     Returns:
     - None
     """
-    saturation_hover_text = []
-    for t_val, w_sat in zip(temp_range, saturation_w):
-        try:
-            rh = 100.0  # %
-            twb = psychrolib.GetTWetBulbFromHumRatio(t_val, w_sat, pressure)
-            h = psychrolib.GetMoistAirEnthalpy(t_val, w_sat) / 1000  # kJ/kg
-            text = generate_hover_text(
-                Saturation_Curve="RH=100%",
-                Temperature=f"{t_val:.1f}°C",
-                Humidity_Ratio=f"{w_sat:.3f} kg/kg",
-                Relative_Humidity=f"{rh}%",
-                Wet_Bulb_Temp=f"{twb:.1f}°C",
-                Enthalpy=f"{h:.1f} kJ/kg"
-            )
-        except Exception as e:
-            logging.error(f"Error computing saturation curve parameters for T={t_val}°C: {e}")
-            text = "Invalid Data"
-        saturation_hover_text.append(text)
+    fig.add_traces(_saturation_traces(temp_range, saturation_w, pressure))
 
-    fig.add_trace(go.Scatter(
-        x=temp_range,
-        y=saturation_w,
+def _relative_humidity_traces(temp_range, rh_values, pressure, w_sat_table=None):
+    """
+    Builds the traces drawn by plot_relative_humidity_lines.
+    """
+    if w_sat_table is None:
+        w_sat_table = _sat_hum_ratio(temp_range, pressure)
+
+    # Evaluate all properties on the (RH, T) grid at once; row i belongs to rh_values[i]
+    rel_hum = np.asarray(rh_values, dtype=float)[:, None] / 100.0
+    rel_hum = np.where((rel_hum >= 0) & (rel_hum <= 1), rel_hum, np.nan)
+    T2d = np.broadcast_to(temp_range, (len(rh_values), len(temp_range)))
+    W2d = _hum_ratio_from_vap_pres(rel_hum * _sat_vap_pres(temp_range), pressure)
+    valid = W2d <= w_sat_table
+    _, twb, h = _psychro_properties(T2d, W2d, pressure)
+    customdata = np.stack([np.broadcast_to(np.asarray(rh_values)[:, None], twb.shape), twb, h], axis=-1)
+
+    segments = []
+    for i, rh in enumerate(rh_values):
+        row = valid[i]
+        if not row.any():
+            logger.error("Error computing RH line for RH=%s%%: no valid temperatures", rh)
+            continue
+        segments.append((T2d[i, row], W2d[i, row], customdata[i, row]))
+
+    # All RH lines share one style, so they go into a single NaN-separated trace
+    if not segments:
+        return []
+    x, y, line_data = _join_line_segments(segments)
+    return [go.Scatter(
+        x=x,
+        y=y,
         mode='lines',
-        line=dict(color=COLOR_SATURATION, width=2),
-        name='Saturation (RH=100%)',
+        line=dict(color=COLOR_RH_LINE, width=LINE_WIDTH_RH, dash=LINE_STYLE_RH),
+        connectgaps=False,
+        name='RH lines',
         showlegend=False,
-        hoverinfo='text',
-        hovertext=saturation_hover_text
-    ))
+        customdata=line_data,
+        hovertemplate=_hover_template(_HOVER_RH, x, line_data)
+    )]
 
-def plot_relative_humidity_lines(fig, temp_range, rh_values, pressure):
+def plot_relative_humidity_lines(fig, temp_range, rh_values, pressure, w_sat_table=None):
     """
     Plots Relative Humidity (RH) lines on the psychrometric chart.
 
@@ -267,50 +515,13 @@ def plot_relative_humidity_lines(fig, temp_range, rh_values, pressure):
     - temp_range (numpy.ndarray): Array of temperature values.
     - rh_values (numpy.ndarray): Array of RH values to plot.
     - pressure (float): Atmospheric pressure in Pascals.
+    - w_sat_table (numpy.ndarray, optional): Saturation humidity ratio for each value of temp_range;
+      computed when not given.
 
     Returns:
     - None
     """
-    for rh in rh_values:
-        temp_rh = []
-        w_rh = []
-        hover_rh = []
-        for t_val in temp_range:
-            try:
-                w_val = psychrolib.GetHumRatioFromRelHum(t_val, rh / 100.0, pressure)
-                w_sat = psychrolib.GetHumRatioFromRelHum(t_val, 1.0, pressure)
-                if w_val <= w_sat:
-                    temp_rh.append(t_val)
-                    w_rh.append(w_val)
-                    # Compute hover text
-                    twb = psychrolib.GetTWetBulbFromHumRatio(t_val, w_val, pressure)
-                    h = psychrolib.GetMoistAirEnthalpy(t_val, w_val) / 1000  # kJ/kg
-                    text = generate_hover_text(
-                        Relative_Humidity=f"{rh}%",
-                        Temperature=f"{t_val:.1f}°C",
-                        Humidity_Ratio=f"{w_val:.3f} kg/kg",
-                        Wet_Bulb_Temp=f"{twb:.1f}°C",
-                        Enthalpy=f"{h:.1f} kJ/kg"
-                    )
-                    hover_rh.append(text)
-            except Exception as e:
-                logging.error(f"Error computing RH line for RH={rh}%, T={t_val}°C: {e}")
-                continue  # Skip if calculation fails
-
-        if temp_rh and w_rh:
-            # Include in legend only every 20% RH to avoid clutter
-            # show_in_legend = bool(rh % 20 == 0)
-            show_in_legend = False
-            fig.add_trace(go.Scatter(
-                x=temp_rh,
-                y=w_rh,
-                mode='lines',
-                line=dict(color=COLOR_RH_LINE, width=LINE_WIDTH_RH, dash=LINE_STYLE_RH),
-                name=f'RH={rh}%',
-                showlegend=show_in_legend,
-                hoverinfo='text',
-                hovertext=hover_rh
-            ))
+    fig.add_traces(_relative_humidity_traces(temp_range, rh_values, pressure, w_sat_table))
 
 def add_state_points(fig, state_points):
     """
@@ -371,7 +582,7 @@ def add_state_points(fig, state_points):
             ))
 
         except Exception as e:
-            logging.error(f"Error adding State Point '{point.name}': {e}")
+            logger.error("Error adding State Point '%s': %s", point.name, e)
             continue  # Skip adding this state point
 
     fig.update_layout(
@@ -390,6 +601,60 @@ def add_state_points(fig, state_points):
 
 
 
+@lru_cache(maxsize=8)
+def _psych_chart_figure(temp_min, temp_max, temp_step,
+                        humidity_ratio_min, humidity_ratio_max, humidity_ratio_step,
+                        enthalpy_min, enthalpy_max, enthalpy_step,
+                        rh_min, rh_max, rh_step,
+                        pressure):
+    """
+    Builds the psychrometric chart for get_psych_chart. The cached figure is never handed
+    out directly; callers get a copy.
+    """
+    # Generate ranges
+    temp_range = np.arange(temp_min, temp_max + temp_step, temp_step)
+    humidity_ratios = np.arange(humidity_ratio_min, humidity_ratio_max + humidity_ratio_step, humidity_ratio_step)
+    enthalpy_values = np.arange(enthalpy_min, enthalpy_max + enthalpy_step, enthalpy_step)
+    rh_values = np.arange(rh_min, rh_max + rh_step, rh_step)
+
+    # Saturation humidity ratio table, computed once and shared by all line families
+    w_saturation = _sat_hum_ratio(temp_range, pressure)
+    if np.isnan(w_saturation).any():
+        logger.error("Saturation humidity ratio undefined for T=%s°C", temp_range[np.isnan(w_saturation)])
+
+    # Build all chart components
+    traces = (
+        _humidity_ratio_traces(temp_range, humidity_ratios, pressure, w_saturation)
+        + _temperature_traces(temp_range, temp_step, COLOR_LIGHT_GREY, COLOR_DARK_GREY, LINE_WIDTH_MINOR, LINE_WIDTH_MAJOR,
+                              pressure, w_saturation)
+        #TODO: Fix this
+        # + _enthalpy_traces(temp_range, enthalpy_values, temp_min, temp_max, pressure, w_saturation)
+        + _saturation_traces(temp_range, w_saturation, pressure)
+        + _relative_humidity_traces(temp_range, rh_values, pressure, w_saturation)
+    )
+
+    layout = dict(
+        title='Psychrometric Chart',
+        # legend_title='Lines',
+        template='plotly_white',
+        width=900,
+        height=700,
+        xaxis=dict(
+            title=dict(text='Dry-Bulb Temperature (°C)'),
+            range=[temp_min, temp_max],
+            showgrid=False
+        ),
+        yaxis=dict(
+            title=dict(text='Humidity Ratio (kg/kg)'),
+            range=[0, np.nanmax(w_saturation) * 1.05],
+            showgrid=False,
+            side='right'  # Position the y-axis on the right side
+        ),
+        hovermode='closest'
+    )
+
+    return go.Figure(data=traces, layout=layout)
+
 def get_psych_chart(temp_min=5, temp_max=45, temp_step=0.5,
                   humidity_ratio_min=0.005, humidity_ratio_max=0.030, humidity_ratio_step=0.005,
                   enthalpy_min=10, enthalpy_max=120, enthalpy_step=10,
@@ -417,52 +682,12 @@ def get_psych_chart(temp_min=5, temp_max=45, temp_step=0.5,
     Returns:
     - fig (go.Figure): The completed psychrometric chart.
     """
-    # Generate ranges
-    temp_range = np.arange(temp_min, temp_max + temp_step, temp_step)
-    humidity_ratios = np.arange(humidity_ratio_min, humidity_ratio_max + humidity_ratio_step, humidity_ratio_step)
-    enthalpy_values = np.arange(enthalpy_min, enthalpy_max + enthalpy_step, enthalpy_step)
-    rh_values = np.arange(rh_min, rh_max + rh_step, rh_step)
-
-    # Compute saturation humidity ratio
-    w_saturation = []
-    for t in temp_range:
-        try:
-            w_sat = psychrolib.GetHumRatioFromRelHum(t, 1.0, pressure)
-            w_saturation.append(w_sat)
-        except Exception as e:
-            logging.error(f"Error computing saturation humidity ratio for T={t}°C: {e}")
-            w_saturation.append(None)
-
-    # Initialize Plotly figure
-    fig = go.Figure()
-
-    # Plot all chart components
-    plot_humidity_ratio_lines(fig, temp_range, humidity_ratios, pressure)
-    plot_temperature_lines(fig, temp_range, temp_step, COLOR_LIGHT_GREY, COLOR_DARK_GREY, LINE_WIDTH_MINOR, LINE_WIDTH_MAJOR, pressure)
-    #TODO: Fix this
-    # plot_enthalpy_lines(fig, temp_range, enthalpy_values, temp_min, temp_max, pressure)
-    plot_saturation_curve(fig, temp_range, w_saturation, pressure)
-    plot_relative_humidity_lines(fig, temp_range, rh_values, pressure)
-
-    # Update layout
-    fig.update_layout(
-        title='Psychrometric Chart',
-        xaxis_title='Dry-Bulb Temperature (°C)',
-        yaxis_title='Humidity Ratio (kg/kg)',
-        # legend_title='Lines',
-        template='plotly_white',
-        width=900,
-        height=700,
-        xaxis=dict(
-            range=[temp_min, temp_max],
-            showgrid=False
-        ),
-        yaxis=dict(
-            range=[0, max(filter(None, w_saturation)) * 1.05],
-            showgrid=False,
-            side='right'  # Position the y-axis on the right side
-        ),
-        hovermode='closest'
-    )
-
-    return fig
\ No newline at end of file
+    # The chart only depends on these arguments, so each distinct chart is built once and
+    # every call gets its own copy. Arguments are normalised to float so that equal values
+    # share a cache entry and array-like scalars (e.g. a 0-d ndarray pressure) stay hashable.
+    args = [float(arg) for arg in (temp_min, temp_max, temp_step,
+                                   humidity_ratio_min, humidity_ratio_max, humidity_ratio_step,
+                                   enthalpy_min, enthalpy_max, enthalpy_step,
+                                   rh_min, rh_max, rh_step,
+                                   pressure)]
+    return go.Figure(_psych_chart_figure(*args))
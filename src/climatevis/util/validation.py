@@ -10,11 +10,8 @@ from typing import List, Union, Optional, Any, Dict
 import pandas as pd
 import numpy as np
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Module logger; handlers and levels are left to the application
+logger = logging.getLogger(__name__)
 
 # Predefined paper sizes for validation
 PAPER_SIZES = {
@@ -120,9 +117,10 @@ def validate_series_attributes(
                     f"Set it with: series.name = 'Your Series Name'"
                 )
             else:
-                logging.warning(
-                    f"{function_name}: {series_name} has no name attribute. "
-                    f"Consider setting series.name for better plot labels."
+                logger.warning(
+                    "%s: %s has no name attribute. "
+                    "Consider setting series.name for better plot labels.",
+                    function_name, series_name
                 )
 
         # Check for unit attribute
@@ -133,9 +131,10 @@ def validate_series_attributes(
                     f"Set it with: series.attrs['unit'] = 'Your Unit'"
                 )
             else:
-                logging.warning(
-                    f"{function_name}: {series_name} has no unit attribute. "
-                    f"Consider setting series.attrs['unit'] for better axis labels."
+                logger.warning(
+                    "%s: %s has no unit attribute. "
+                    "Consider setting series.attrs['unit'] for better axis labels.",
+                    function_name, series_name
                 )
 
 
@@ -187,11 +186,12 @@ def validate_datetime_compatibility(
             min_duration = min(ref_duration, curr_duration)
 
             if overlap_duration < min_duration * 0.5:
-                logging.warning(
-                    f"{function_name}: Series {i} ({series.name or 'unnamed'}) has "
-                    f"limited time overlap with the first series. "
-                    f"Overlap: {overlap_duration}, "
-                    f"Minimum expected: {min_duration * 0.5}"
+                logger.warning(
+                    "%s: Series %s (%s) has "
+                    "limited time overlap with the first series. "
+                    "Overlap: %s, "
+                    "Minimum expected: %s",
+                    function_name, i, series.name or 'unnamed', overlap_duration, min_duration * 0.5
                 )
 
 
@@ -260,36 +260,43 @@ def validate_data_quality(
     for i, series in enumerate(series_list):
         series_name = series.name or f"Series {i}"
 
+        # Scan the values once as a float array for all checks below
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        nan_mask = np.isnan(values)
+
         # Check for NaN values
-        nan_count = series.isna().sum().item()
+        nan_count = int(nan_mask.sum())
         if nan_count > 0:
-            logging.warning(
-                f"{function_name}: {series_name} contains {nan_count} NaN values "
-                f"({nan_count/len(series)*100:.1f}% of data). "
-                f"These will be excluded from plotting."
+            logger.warning(
+                "%s: %s contains %s NaN values "
+                "(%.1f%% of data). "
+                "These will be excluded from plotting.",
+                function_name, series_name, nan_count, nan_count/len(series)*100
             )
 
         # Check for infinite values
-        inf_count = np.isinf(series).sum().item()
+        inf_count = int(np.isinf(values).sum())
         if inf_count > 0:
-            logging.warning(
-                f"{function_name}: {series_name} contains {inf_count} infinite values. "
-                f"These will be excluded from plotting."
+            logger.warning(
+                "%s: %s contains %s infinite values. "
+                "These will be excluded from plotting.",
+                function_name, series_name, inf_count
             )
 
         # Check for empty series after removing NaN/Inf
-        valid_data = series.dropna()
-        if len(valid_data) == 0:
+        valid_values = values[~nan_mask] if nan_count else values
+        if len(valid_values) == 0:
             raise ValueError(
                 f"{function_name}: {series_name} has no valid data after removing "
                 f"NaN and infinite values."
             )
 
-        # Check for constant data (might indicate issues)
-        if len(valid_data) > 1 and valid_data.std().item() == 0:
-            logging.info(
-                f"{function_name}: {series_name} has constant values "
-                f"({valid_data.iloc[0]}). This may result in a flat line plot."
+        # Check for constant data (might indicate issues); equal finite extremes mean zero spread
+        if len(valid_values) > 1 and np.isfinite(valid_values[0]) and valid_values.min() == valid_values.max():
+            logger.info(
+                "%s: %s has constant values "
+                "(%s). This may result in a flat line plot.",
+                function_name, series_name, series.dropna().iloc[0]
             )
 
 
@@ -220,6 +220,111 @@ class TestPlottingFunctions:
                 pytest.fail(f"Plot creation with mode '{mode}' failed: {e}")
 
 
+class TestMonthlyProfilesBands:
+    """Test monthly profile band plotting"""
+
+    def test_missing_hours_split_into_segments(self):
+        """Test that hours missing from the data produce separate line segments"""
+        dates = pd.date_range('2023-01-01 00:00:00', '2023-12-31 23:00:00', freq='h')
+        dates = dates[(dates.hour < 10) | (dates.hour > 12)]
+        series = pd.Series(np.random.normal(20, 5, len(dates)), index=dates, name="Temperature")
+        series.attrs["unit"] = "°C"
+
+        fig = climatevis.monthly_profiles_bands([series], "base", "A4_LANDSCAPE")
+
+        max_traces = [trace for trace in fig.data if trace.name == "Jan Max (Temperature)"]
+        assert len(max_traces) == 2
+        assert list(max_traces[0].x) == list(range(0, 10))
+        assert list(max_traces[1].x) == list(range(13, 24))
+
+    def test_month_labels_below_lowest_series(self):
+        """Test that the month labels sit at the minimum across all series, not the last one"""
+        dates = pd.date_range('2023-01-01', periods=8760, freq='h')
+        low = pd.Series(np.full(8760, -10.0), index=dates, name="Low")
+        high = pd.Series(np.full(8760, 5.0), index=dates, name="High")
+
+        fig = climatevis.monthly_profiles_bands([low, high], "base", "A4_LANDSCAPE")
+
+        assert len(fig.layout.annotations) == 12
+        assert all(annotation.y == -10.0 for annotation in fig.layout.annotations)
+
+
+class TestHistogram:
+    """Test single-series histogram plotting"""
+
+    def test_hover_text_uses_series_name(self):
+        """Test that the hover label is the series name, or plain "x" for an unnamed series"""
+        dates = pd.date_range('2023-01-01', periods=500, freq='h')
+        values = np.random.normal(20, 5, 500)
+
+        named = climatevis.histogram(pd.Series(values, index=dates, name="Temperature"), "base", "A4_LANDSCAPE")
+        unnamed = climatevis.histogram(pd.Series(values, index=dates), "base", "A4_LANDSCAPE", x_title="Air")
+
+        assert named.data[0].hovertemplate.startswith("Temperature=%{x}<br>")
+        assert unnamed.data[0].hovertemplate.startswith("x=%{x}<br>")
+
+
+class TestMultipleHistograms:
+    """Test overlaid histogram plotting"""
+
+    def test_series_share_bins(self):
+        """Test that all series are binned with the same edges, not the first series' bin count"""
+        from climatevis.plots.histogram_multiple import multiple_histograms
+
+        dates = pd.date_range('2023-01-01', periods=500, freq='h')
+        narrow = pd.Series(np.random.uniform(0, 5, 500), index=dates, name="Narrow")
+        wide = pd.Series(np.random.uniform(0, 50, 500), index=dates, name="Wide")
+
+        fig = multiple_histograms([narrow, wide], "base", "A4_LANDSCAPE")
+
+        assert len(fig.data) == 2
+        assert fig.data[0].xbins == fig.data[1].xbins
+        assert fig.data[0].xbins.start <= min(narrow.min(), wide.min())
+        assert fig.data[0].xbins.end >= max(narrow.max(), wide.max())
+
+
+class TestCumulativeProbability:
+    """Test cumulative probability plotting"""
+
+    def test_large_series_downsampled_with_exact_percentile(self):
+        """Test that long series are drawn from sampled quantiles while the marker uses the full data"""
+        dates = pd.date_range('2023-01-01', periods=8760, freq='h')
+        series = pd.Series(np.random.normal(20, 5, 8760), index=dates, name="Temperature")
+
+        fig = climatevis.cumulative_probability([series], "base", "A4_LANDSCAPE", selected_percentile=90)
+
+        curve, marker = fig.data[0], fig.data[1]
+        assert len(curve.x) == 1024
+        assert curve.x[0] == series.min()
+        assert curve.x[-1] == series.max()
+        assert marker.x[0] == np.sort(series.to_numpy())[int(8760 * 0.9)]
+
+
+class TestExceedanceSummary:
+    """Test exceedance band summary statistics"""
+
+    def test_nan_only_affects_its_own_band(self):
+        """Test that a NaN in the data does not turn the means of the other bands into NaN"""
+        from climatevis.plots.exceedance import calculate_exceedance_summary
+
+        data = np.append(np.arange(1.0, 101.0), np.nan)
+        summary = calculate_exceedance_summary(data, [(0.5, 1.0), (0.0, 0.5)])
+
+        # The NaN sorts to the top, so only the highest band is affected
+        assert np.isnan(summary["Mean"][0])
+        assert summary["Mean"][1] == np.arange(1.0, 52.0).mean()
+
+    def test_single_point_band_mean_is_exact(self):
+        """Test that a one-point band reports its value exactly, even for large values"""
+        from climatevis.plots.exceedance import calculate_exceedance_summary
+
+        data = 1e5 + np.random.default_rng(0).random(1000)
+        summary = calculate_exceedance_summary(data, [(0.0, 0.001)])
+
+        assert summary["Count"][0] == 1
+        assert summary["Mean"][0] == summary["Min"][0] == data.min()
+
+
 class TestTemplateAndPaperSizeOptions:
     """Test template and paper size dropdown functionality"""
 
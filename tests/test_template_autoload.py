@@ -73,6 +73,30 @@ class TestTemplateAutoLoading:
         assert 'base_autosize' in loaded
         assert 'test' in loaded
 
+    def test_user_template_registered_before_first_use_is_kept(self, monkeypatch):
+        """Test that lazy loading does not overwrite a user template with a built-in name."""
+        import plotly.graph_objects as go
+        from climatevis.util import util_plotly
+
+        # Simulate the state right after import, before any template was needed
+        monkeypatch.setattr(util_plotly, '_templates_loaded', False)
+        custom = go.layout.Template(layout=dict(font=dict(size=33)))
+        original = pio.templates['base'] if 'base' in pio.templates else None
+        pio.templates['base'] = custom
+        try:
+            fig = util_plotly.apply_template_to_figure(go.Figure(), 'base')
+
+            assert pio.templates['base'].layout.font.size == 33
+            assert fig.layout.template.layout.font.size == 33
+            # The other built-ins are still registered lazily
+            assert 'base_autosize' in pio.templates
+            assert 'test' in pio.templates
+        finally:
+            if original is None:
+                del pio.templates['base']
+            else:
+                pio.templates['base'] = original
+
 
 class TestTemplateUIComponents:
     """Test template UI component functionality."""
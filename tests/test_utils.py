@@ -10,13 +10,14 @@ import pytest
 from datetime import datetime, timedelta
 
 
-def generate_synthetic_climate_data(hours=8760, start_date='2023-01-01'):
+def generate_synthetic_climate_data(hours=8760, start_date='2023-01-01', seed=42):
     """
     Generate synthetic climate data for testing
 
     Args:
         hours (int): Number of hours to generate (default: 8760 for full year)
         start_date (str): Start date for the data
+        seed (int): Random seed, so repeated calls return identical data
 
     Returns:
         tuple: (temp_series, wind_series) with pandas Series objects
@@ -24,19 +25,33 @@ def generate_synthetic_climate_data(hours=8760, start_date='2023-01-01'):
     # Create hourly datetime index
     dates = pd.date_range(start_date, periods=hours, freq='h')
     n_hours = len(dates)
-    days_of_year = np.arange(n_hours) / 24.0
+    hour_idx = np.arange(n_hours)
+    days_of_year = hour_idx / 24.0
+    hour_of_day = hour_idx % 24
+
+    # Seasonal and daily sinusoids for temperature and wind, evaluated in one np.sin call
+    phases = np.stack([
+        2 * np.pi * (days_of_year - 90) / 365.25,
+        2 * np.pi * (hour_of_day - 6) / 24,
+        2 * np.pi * (days_of_year - 270) / 365.25,
+        2 * np.pi * (hour_of_day - 12) / 24,
+    ])
+    seasonal_temp, daily_temp, seasonal_wind, daily_wind = np.sin(phases)
+
+    rng = np.random.default_rng(seed)
 
     # Generate realistic temperature data with seasonal variation
-    seasonal_component = 15 + 12 * np.sin(2 * np.pi * (days_of_year - 90) / 365.25)
-    daily_component = 8 * np.sin(2 * np.pi * (np.arange(n_hours) % 24 - 6) / 24)
-    noise = np.random.normal(0, 3, n_hours)
-    temperature = seasonal_component + daily_component + noise
+    temperature = np.empty(n_hours)
+    rng.standard_normal(out=temperature)
+    temperature *= 3
+    temperature += 15 + 12 * seasonal_temp + 8 * daily_temp
 
     # Generate realistic wind speed data
-    base_wind = 8 + 4 * np.sin(2 * np.pi * (days_of_year - 270) / 365.25)
-    daily_wind = 2 * np.sin(2 * np.pi * (np.arange(n_hours) % 24 - 12) / 24)
-    wind_noise = np.random.exponential(2, n_hours)
-    wind_speed = np.maximum(0, base_wind + daily_wind + wind_noise)
+    wind_speed = np.empty(n_hours)
+    rng.standard_exponential(out=wind_speed)
+    wind_speed *= 2
+    wind_speed += 8 + 4 * seasonal_wind + 2 * daily_wind
+    np.maximum(wind_speed, 0, out=wind_speed)
 
     # Create pandas Series with proper names and units
     temp_series = pd.Series(temperature, index=dates, name="Air Temperature")
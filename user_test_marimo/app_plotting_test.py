@@ -84,48 +84,102 @@ def setup_climatevis_imports(sys):
 @app.cell
 def generate_synthetic_climate_data(np, pd):
     """Generate synthetic 8760-hour temperature and wind speed data"""
+    import functools
+
     # Create hourly datetime index for a full year (8760 hours)
     dates = pd.date_range('2023-01-01 00:00:00', '2023-12-31 23:00:00', freq='h')
 
     # Verify we have exactly 8760 hours
     n_hours = len(dates)
 
-    # Generate realistic temperature data with seasonal variation
-    days_of_year = np.arange(n_hours) / 24.0
-
-    # Seasonal temperature variation (sine wave with peak in summer)
-    seasonal_component = 15 + 12 * np.sin(2 * np.pi * (days_of_year - 90) / 365.25)
-
-    # Daily temperature variation (cooler at night, warmer during day)
-    daily_component = 8 * np.sin(2 * np.pi * (np.arange(n_hours) % 24 - 6) / 24)
-
-    # Add some realistic noise
-    noise = np.random.normal(0, 3, n_hours)
-
-    temperature = seasonal_component + daily_component + noise
-
-    # Generate realistic wind speed data
-    # Base wind speed with seasonal variation (higher in winter)
-    base_wind = 8 + 4 * np.sin(2 * np.pi * (days_of_year - 270) / 365.25)
-
-    # Daily wind pattern (often higher during day)
-    daily_wind = 2 * np.sin(2 * np.pi * (np.arange(n_hours) % 24 - 12) / 24)
-
-    # Wind speed noise (more variable than temperature)
-    wind_noise = np.random.exponential(2, n_hours)
-
-    wind_speed = np.maximum(0, base_wind + daily_wind + wind_noise)
+    # The data is deterministic for a given length and seed, so it is generated once per
+    # session and reused in memory. The arrays are shared, so they are made read-only.
+    @functools.lru_cache(maxsize=4)
+    def synthesize(n_hours, seed):
+        # Shared time axis
+        hours = np.arange(n_hours)
+        days_of_year = hours / 24.0
+        hour_of_day = hours % 24
+
+        # Evaluate all four sinusoids with a single np.sin call:
+        # - seasonal temperature variation (peak in summer)
+        # - daily temperature variation (cooler at night, warmer during day)
+        # - seasonal wind variation (higher in winter)
+        # - daily wind pattern (often higher during day)
+        phases = np.stack([
+            2 * np.pi * (days_of_year - 90) / 365.25,
+            2 * np.pi * (hour_of_day - 6) / 24,
+            2 * np.pi * (days_of_year - 270) / 365.25,
+            2 * np.pi * (hour_of_day - 12) / 24,
+        ])
+        seasonal_temp, daily_temp, seasonal_wind, daily_wind = np.sin(phases)
+
+        # Fixed seed so the data (and any figures cached from it) is reproducible.
+        # Noise is drawn directly into the output arrays and the components added in place.
+        rng = np.random.default_rng(seed)
+
+        # Temperature with some realistic noise
+        temperature = np.empty(n_hours)
+        rng.standard_normal(out=temperature)
+        temperature *= 3
+        temperature += 15 + 12 * seasonal_temp + 8 * daily_temp
+
+        # Wind speed with noise (more variable than temperature)
+        wind_speed = np.empty(n_hours)
+        rng.standard_exponential(out=wind_speed)
+        wind_speed *= 2
+        wind_speed += 8 + 4 * seasonal_wind + 2 * daily_wind
+        np.maximum(wind_speed, 0, out=wind_speed)
+
+        temperature.flags.writeable = False
+        wind_speed.flags.writeable = False
+        return temperature, wind_speed
+
+    temperature, wind_speed = synthesize(n_hours, seed=42)
 
     # Create pandas Series with proper names and units
-    temp_series = pd.Series(temperature, index=dates, name="Air Temperature")
+    temp_series = pd.Series(temperature, index=dates, name="Air Temperature", copy=False)
     temp_series.attrs["unit"] = "°C"
 
-    wind_series = pd.Series(wind_speed, index=dates, name="Wind Speed")
+    wind_series = pd.Series(wind_speed, index=dates, name="Wind Speed", copy=False)
     wind_series.attrs["unit"] = "m/s"
 
     return n_hours, temp_series, wind_series
 
 
+@app.cell
+def create_figure_factory(plot_series, temp_series, wind_series):
+    """Build time series figures on demand, memoized by plot kind and control values"""
+    import functools
+
+    # The full 8760-point traces are sent as-is. plotly-resampler's FigureResampler only
+    # re-aggregates on zoom through a Dash callback, which marimo cannot host, so wrapping
+    # would leave every trace permanently cut down to its initial ~1000-point overview.
+
+    # Series and y-axis title for each kind of plot
+    plot_inputs = {
+        "temperature": ([temp_series], "Air Temperature"),
+        "wind": ([wind_series], "Wind Speed"),
+        "combined": ([temp_series, wind_series], "Climate Variables"),
+    }
+
+    # The cache is rebuilt whenever this cell reruns, i.e. whenever the data changes,
+    # so only the control values need to be part of the key
+    @functools.lru_cache(maxsize=32)
+    def build_figure(kind, template_name, paper_size, mode):
+        series_list, y1_axis_title = plot_inputs[kind]
+        fig = plot_series(
+            series_list,
+            template_name=template_name,
+            paper_size=paper_size,
+            y1_axis_title=y1_axis_title,
+            mode=mode
+        )
+        return fig
+
+    return (build_figure,)
+
+
 @app.cell
 def create_plotting_controls(create_paper_size_dropdown, create_template_dropdown, mo, success):
     """Create UI controls for plot customization"""
@@ -207,22 +261,27 @@ def display_app_header_and_controls(
 
 @app.cell
 def create_temperature_plot(
+    build_figure,
     mode_dropdown,
     paper_size_dropdown,
     plot_series,
     success,
-    temp_series,
     template_dropdown,
+    variable_dropdown,
 ):
     """Create temperature time series plot"""
-    if success and plot_series is not None:
+    if variable_dropdown.value != "temperature":
+        # Not displayed for the current selection, so skip building it
+        fig_temperature = None
+        temp_plot_success = False
+        temp_plot_error = None
+    elif success and plot_series is not None:
         try:
-            fig_temperature = plot_series(
-                [temp_series],
-                template_name=template_dropdown.value,
-                paper_size=paper_size_dropdown.value,
-                y1_axis_title="Air Temperature",
-                mode=mode_dropdown.value
+            fig_temperature = build_figure(
+                "temperature",
+                template_dropdown.value,
+                paper_size_dropdown.value,
+                mode_dropdown.value
             )
             temp_plot_success = True
             temp_plot_error = None
@@ -240,22 +299,27 @@ def create_temperature_plot(
 
 @app.cell
 def create_wind_plot(
+    build_figure,
     mode_dropdown,
     paper_size_dropdown,
     plot_series,
     success,
     template_dropdown,
-    wind_series,
+    variable_dropdown,
 ):
     """Create wind speed time series plot"""
-    if success and plot_series is not None:
+    if variable_dropdown.value != "wind":
+        # Not displayed for the current selection, so skip building it
+        fig_wind = None
+        wind_plot_success = False
+        wind_plot_error = None
+    elif success and plot_series is not None:
         try:
-            fig_wind = plot_series(
-                [wind_series],
-                template_name=template_dropdown.value,
-                paper_size=paper_size_dropdown.value,
-                y1_axis_title="Wind Speed",
-                mode=mode_dropdown.value
+            fig_wind = build_figure(
+                "wind",
+                template_dropdown.value,
+                paper_size_dropdown.value,
+                mode_dropdown.value
             )
             wind_plot_success = True
             wind_plot_error = None
@@ -273,23 +337,27 @@ def create_wind_plot(
 
 @app.cell
 def create_combined_plot(
+    build_figure,
     mode_dropdown,
     paper_size_dropdown,
     plot_series,
     success,
-    temp_series,
     template_dropdown,
-    wind_series,
+    variable_dropdown,
 ):
     """Create combined temperature and wind plot with dual y-axes"""
-    if success and plot_series is not None:
+    if variable_dropdown.value != "both":
+        # Not displayed for the current selection, so skip building it
+        fig_combined = None
+        combined_plot_success = False
+        combined_plot_error = None
+    elif success and plot_series is not None:
         try:
-            fig_combined = plot_series(
-                [temp_series, wind_series],
-                template_name=template_dropdown.value,
-                paper_size=paper_size_dropdown.value,
-                y1_axis_title="Climate Variables",
-                mode=mode_dropdown.value
+            fig_combined = build_figure(
+                "combined",
+                template_dropdown.value,
+                paper_size_dropdown.value,
+                mode_dropdown.value
             )
             combined_plot_success = True
             combined_plot_error = None